@@ -9,6 +9,9 @@ Usage:
     # Create alert
     python alert_manager.py create --severity critical --message "Service down" --actions "Restart docker"
 
+    # Create many alerts at once (JSON lines: severity, message, type, actions, agent)
+    python alert_manager.py create-batch < alerts.jsonl
+
     # Check alerts before phase transition
     python alert_manager.py check-transition --to-phase 3
 
@@ -23,11 +26,19 @@ Created: 2025-12-14
 """
 
 import argparse
-import json
+import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import json_compat
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; file locking is skipped there
+    fcntl = None
 
 # =============================================================================
 # CONFIGURATION
@@ -35,10 +46,28 @@ from typing import List, Dict, Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 ALERTS_FILE = PROJECT_ROOT / ".claude-bus" / "notifications" / "user-alerts.jsonl"
+ALERT_COUNTER_FILE = ALERTS_FILE.with_suffix(".counter")  # Last issued alert ID
 
 SEVERITY_LEVELS = ["critical", "high", "medium", "low"]
 NOTIFICATION_TYPES = ["blocker_alert", "service_health", "security", "performance", "tech_debt"]
 
+SEVERITY_EMOJI = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🔵"
+}
+
+# Alert writes are coalesced in a 1 MB buffer and flushed once
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Resolutions are appended as tombstones instead of rewriting the file
+RESOLVE_OP = "resolve"
+_RESOLVE_PREFIX = b'{"op":'
+
+# Parsed alerts keyed on (st_mtime_ns, st_size) of ALERTS_FILE
+_ALERT_CACHE = {"key": None, "data": None}
+
 
 # =============================================================================
 # ALERT SCHEMA
@@ -49,7 +78,8 @@ def create_alert_record(
     message: str,
     notification_type: str = "blocker_alert",
     suggested_actions: List[str] = None,
-    agent: str = "PM-Architect-Agent"
+    agent: str = "PM-Architect-Agent",
+    next_id: Optional[int] = None
 ) -> Dict:
     """
     Create a standardized alert record.
@@ -60,13 +90,14 @@ def create_alert_record(
         notification_type: Type of notification
         suggested_actions: List of suggested actions
         agent: Agent creating the alert
+        next_id: Explicit numeric ID (batch creation); reserved from the counter if omitted
 
     Returns:
         Alert record dictionary
     """
     # Generate next ID
-    existing = load_alerts()
-    next_id = len(existing) + 1
+    if next_id is None:
+        next_id = reserve_alert_ids()
 
     return {
         "id": f"notify-{next_id:03d}",
@@ -84,54 +115,256 @@ def create_alert_record(
 # ALERT OPERATIONS
 # =============================================================================
 
-def load_alerts() -> List[Dict]:
-    """Load all alerts from file."""
-    if not ALERTS_FILE.exists():
-        return []
+@contextmanager
+def _file_lock(f, exclusive: bool = True) -> Iterator[None]:
+    """Hold an advisory flock on an open file (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _invalidate_alert_cache() -> None:
+    """Drop cached alerts after the file has been written."""
+    _ALERT_CACHE["key"] = None
+    _ALERT_CACHE["data"] = None
+
+
+def iter_alerts() -> Iterator[Dict]:
+    """
+    Yield current alerts, folding resolve records into their alerts.
+
+    The alerts file is append-only: alert records are written once and
+    resolutions are appended as {"op": "resolve", ...} tombstones. The
+    folded result is cached until the file changes.
+    """
+    try:
+        st = ALERTS_FILE.stat()
+    except FileNotFoundError:
+        return
 
-    alerts = []
-    with open(ALERTS_FILE, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
+    key = (st.st_mtime_ns, st.st_size)
+    if _ALERT_CACHE["key"] != key:
+        by_id = {}
+        with open(ALERTS_FILE, "rb") as f, _file_lock(f, exclusive=False):
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
                 try:
-                    alerts.append(json.loads(line))
-                except json.JSONDecodeError:
+                    record = json_compat.loads(line)
+                except json_compat.JSONDecodeError:
                     continue
-    return alerts
+
+                if record.get("op") == RESOLVE_OP:
+                    alert = by_id.get(record.get("id"))
+                    if alert is not None:
+                        alert["status"] = "resolved"
+                        alert["resolved_at"] = record.get("resolved_at")
+                else:
+                    by_id[record.get("id", len(by_id))] = record
+
+        _ALERT_CACHE["key"] = key
+        _ALERT_CACHE["data"] = list(by_id.values())
+
+    yield from _ALERT_CACHE["data"]
+
+
+def load_alerts() -> List[Dict]:
+    """Load all alerts from file (cached until the file changes)."""
+    return list(iter_alerts())
+
+
+def count_alerts() -> int:
+    """Count alert records (not resolve records) without decoding JSON."""
+    try:
+        with open(ALERTS_FILE, "rb") as f:
+            return sum(
+                1 for line in f
+                if line.strip() and not line.startswith(_RESOLVE_PREFIX)
+            )
+    except FileNotFoundError:
+        return 0
+
+
+class AlertWriter:
+    """
+    Buffered appender for the alerts file.
+
+    Records added inside the context are written with a single write()
+    on exit instead of one open/write/close per alert. Pass durable=True
+    to also fsync() the file before returning.
+
+    Usage:
+        with AlertWriter() as writer:
+            writer.add(alert)
+    """
+
+    def __init__(self, path: Path = None, durable: bool = False):
+        self.path = path or ALERTS_FILE
+        self.durable = durable
+        self._lines: List[str] = []
+        self._file = None
+
+    def __enter__(self) -> "AlertWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        return self
+
+    def add(self, record: Dict) -> None:
+        """Queue a record for the next flush."""
+        self._lines.append(json_compat.dumps(record) + "\n")
+
+    def flush(self) -> None:
+        """Write queued records in one call (and fsync if durable)."""
+        if not self._lines:
+            return
+        # Exclusive lock so concurrent writers never interleave partial lines
+        with _file_lock(self._file):
+            self._file.write("".join(self._lines))
+            self._file.flush()
+            if self.durable:
+                os.fsync(self._file.fileno())
+        self._lines.clear()
+        _invalidate_alert_cache()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+            self._file = None
+
+
+def reserve_alert_ids(count: int = 1) -> int:
+    """
+    Reserve `count` consecutive alert IDs from the counter file.
+
+    The counter holds the last issued ID, so creating an alert no longer
+    rescans the alerts file. A missing or unreadable counter is seeded
+    from count_alerts() once.
+
+    Returns:
+        First reserved ID
+    """
+    ALERT_COUNTER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(ALERT_COUNTER_FILE, "a+", encoding="utf-8") as f, _file_lock(f):
+        f.seek(0)
+        try:
+            last_id = int(f.read().strip())
+        except ValueError:
+            last_id = count_alerts()
+
+        f.seek(0)
+        f.truncate()
+        f.write(str(last_id + count))
+        f.flush()
+
+    return last_id + 1
 
 
 def save_alert(alert: Dict) -> None:
     """Append alert to file."""
-    ALERTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(ALERTS_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(alert) + "\n")
+    save_alerts([alert])
+
+
+def save_alerts(alerts: Iterable[Dict], durable: bool = False) -> None:
+    """
+    Append many alerts with one open and one write.
+
+    Args:
+        alerts: Alert records to append
+        durable: fsync the alerts file so the batch survives a crash
+            (slower; off by default)
+    """
+    with AlertWriter(durable=durable) as writer:
+        for alert in alerts:
+            writer.add(alert)
 
 
 def get_active_alerts() -> List[Dict]:
     """Get only active (unresolved) alerts."""
-    return [a for a in load_alerts() if a.get("status") == "active"]
+    return [a for a in iter_alerts() if a.get("status") == "active"]
+
+
+def append_resolve(alert_id: str) -> None:
+    """Append a resolve tombstone for an alert."""
+    record = {
+        "op": RESOLVE_OP,
+        "id": alert_id,
+        "resolved_at": datetime.now().isoformat()
+    }
+    with AlertWriter() as writer:
+        writer.add(record)
 
 
 def resolve_alert(alert_id: str) -> bool:
-    """Mark alert as resolved."""
-    alerts = load_alerts()
-    updated = False
+    """Mark alert as resolved (O(1) append, no file rewrite)."""
+    if not any(a.get("id") == alert_id for a in iter_alerts()):
+        return False
 
-    for alert in alerts:
-        if alert.get("id") == alert_id:
-            alert["status"] = "resolved"
-            alert["resolved_at"] = datetime.now().isoformat()
-            updated = True
-            break
+    append_resolve(alert_id)
+    return True
 
-    if updated:
-        # Rewrite file
-        with open(ALERTS_FILE, "w", encoding="utf-8") as f:
-            for alert in alerts:
-                f.write(json.dumps(alert) + "\n")
 
-    return updated
+def create_alerts_from_lines(lines: Iterable[str], durable: bool = False) -> List[Dict]:
+    """
+    Create alerts from JSON lines and write them in one batch.
+
+    Each line holds an object with "severity" and "message" plus optional
+    "type", "actions" and "agent". Invalid lines are reported on stderr
+    and skipped.
+
+    Args:
+        lines: JSON lines, one alert spec per line
+        durable: fsync the alerts file after the batch is written
+
+    Returns:
+        List of created alert records
+    """
+    specs = []
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            spec = json_compat.loads(line)
+        except json_compat.JSONDecodeError as e:
+            print(f"❌ Line {line_no}: invalid JSON ({e})", file=sys.stderr)
+            continue
+
+        severity = spec.get("severity")
+        notification_type = spec.get("type", "blocker_alert")
+        if severity not in SEVERITY_LEVELS or not spec.get("message"):
+            print(f"❌ Line {line_no}: severity and message are required", file=sys.stderr)
+            continue
+        if notification_type not in NOTIFICATION_TYPES:
+            print(f"❌ Line {line_no}: invalid type '{notification_type}'", file=sys.stderr)
+            continue
+        specs.append(spec)
+
+    if not specs:
+        return []
+
+    first_id = reserve_alert_ids(len(specs))
+    created = [
+        create_alert_record(
+            severity=spec["severity"],
+            message=spec["message"],
+            notification_type=spec.get("type", "blocker_alert"),
+            suggested_actions=spec.get("actions"),
+            agent=spec.get("agent", "PM-Architect-Agent"),
+            next_id=first_id + offset
+        )
+        for offset, spec in enumerate(specs)
+    ]
+    save_alerts(created, durable=durable)
+
+    return created
 
 
 # =============================================================================
@@ -147,11 +380,19 @@ def check_phase_transition(to_phase: int) -> Dict:
     Returns:
         dict with: can_proceed, status, message, alerts
     """
-    active = get_active_alerts()
-
-    critical = [a for a in active if a.get("severity") == "critical"]
-    high = [a for a in active if a.get("severity") == "high"]
-    medium_low = [a for a in active if a.get("severity") in ["medium", "low"]]
+    # Single pass bucketing active alerts by severity; once a critical alert
+    # is seen the result is BLOCKED, so lower severities are no longer kept.
+    critical, high, medium_low = [], [], []
+    buckets = {"critical": critical, "high": high, "medium": medium_low, "low": medium_low}
+    for alert in iter_alerts():
+        if alert.get("status") != "active":
+            continue
+        severity = alert.get("severity")
+        if critical and severity != "critical":
+            continue
+        bucket = buckets.get(severity)
+        if bucket is not None:
+            bucket.append(alert)
 
     if critical:
         return {
@@ -195,14 +436,7 @@ def check_phase_transition(to_phase: int) -> Dict:
 
 def print_alert_created(alert: Dict) -> None:
     """Print alert creation confirmation."""
-    severity_emoji = {
-        "critical": "🔴",
-        "high": "🟠",
-        "medium": "🟡",
-        "low": "🔵"
-    }
-
-    emoji = severity_emoji.get(alert["severity"], "❓")
+    emoji = SEVERITY_EMOJI.get(alert["severity"], "❓")
 
     print(f"\n{emoji} Alert Created: {alert['id']}")
     print(f"   Severity: {alert['severity'].upper()}")
@@ -218,7 +452,7 @@ def print_alert_created(alert: Dict) -> None:
 
 
 def print_transition_check(result: Dict) -> None:
-    """Print phase transition check result."""
+    """Print phase transition check result (one stdout write)."""
     status_banner = {
         "BLOCKED": "❌ BLOCKED",
         "WARNING": "⚠️  WARNING",
@@ -226,43 +460,55 @@ def print_transition_check(result: Dict) -> None:
         "OK": "✅ OK"
     }
 
-    print(f"\n{'='*60}")
-    print(f"  Phase Transition Check: {status_banner.get(result['status'], '?')}")
-    print(f"{'='*60}\n")
-
-    print(f"  {result['message']}")
+    lines = [
+        "",
+        "=" * 60,
+        f"  Phase Transition Check: {status_banner.get(result['status'], '?')}",
+        "=" * 60,
+        "",
+        f"  {result['message']}",
+    ]
     if result.get("reason"):
-        print(f"  Reason: {result['reason']}")
+        lines.append(f"  Reason: {result['reason']}")
 
     if result.get("alerts"):
-        print(f"\n  Active Issues ({len(result['alerts'])}):")
+        lines.append("")
+        lines.append(f"  Active Issues ({len(result['alerts'])}):")
         for alert in result["alerts"]:
-            emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🔵"}.get(alert["severity"], "❓")
-            print(f"    {emoji} [{alert['id']}] {alert['message']}")
+            emoji = SEVERITY_EMOJI.get(alert["severity"], "❓")
+            lines.append(f"    {emoji} [{alert['id']}] {alert['message']}")
 
     if result.get("requires_confirmation"):
-        print("\n  ⚠️  Confirmation required to proceed.")
+        lines.append("")
+        lines.append("  ⚠️  Confirmation required to proceed.")
 
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_alert_list(alerts: List[Dict]) -> None:
-    """Print list of alerts."""
+    """Print list of alerts (one stdout write)."""
     if not alerts:
         print("\n  No active alerts.\n")
         return
 
-    print(f"\n{'='*60}")
-    print(f"  Active Alerts ({len(alerts)})")
-    print(f"{'='*60}\n")
+    lines = [
+        "",
+        "=" * 60,
+        f"  Active Alerts ({len(alerts)})",
+        "=" * 60,
+        "",
+    ]
 
     for alert in alerts:
-        emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🔵"}.get(alert["severity"], "❓")
+        emoji = SEVERITY_EMOJI.get(alert["severity"], "❓")
         status = "🔓" if alert.get("status") == "resolved" else "🔒"
-        print(f"  {emoji} {status} [{alert['id']}] {alert['severity'].upper()}")
-        print(f"       {alert['message']}")
-        print(f"       Created: {alert.get('timestamp', 'unknown')}")
-        print()
+        lines.append(f"  {emoji} {status} [{alert['id']}] {alert['severity'].upper()}")
+        lines.append(f"       {alert['message']}")
+        lines.append(f"       Created: {alert.get('timestamp', 'unknown')}")
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =============================================================================
@@ -281,6 +527,12 @@ def main():
     create_parser.add_argument("--actions", nargs="+", help="Suggested actions")
     create_parser.add_argument("--agent", default="PM-Architect-Agent")
 
+    # Batch create command (JSON lines on stdin)
+    subparsers.add_parser(
+        "create-batch",
+        help="Create alerts from JSON lines on stdin (one write + fsync)"
+    )
+
     # Check transition command
     check_parser = subparsers.add_parser("check-transition", help="Check phase transition")
     check_parser.add_argument("--to-phase", type=int, required=True)
@@ -308,10 +560,16 @@ def main():
         save_alert(alert)
         print_alert_created(alert)
 
+    elif args.command == "create-batch":
+        created = create_alerts_from_lines(sys.stdin, durable=True)
+        for alert in created:
+            print(f"✅ Alert Created: {alert['id']} [{alert['severity'].upper()}] {alert['message']}")
+        print(f"\n   {len(created)} alert(s) logged to: {ALERTS_FILE}\n")
+
     elif args.command == "check-transition":
         result = check_phase_transition(args.to_phase)
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(json_compat.dumps(result, indent=True))
         else:
             print_transition_check(result)
 
@@ -326,7 +584,7 @@ def main():
     elif args.command == "list":
         alerts = load_alerts() if args.all else get_active_alerts()
         if args.json:
-            print(json.dumps(alerts, indent=2))
+            print(json_compat.dumps(alerts, indent=True))
         else:
             print_alert_list(alerts)
 
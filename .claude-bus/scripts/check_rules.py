@@ -22,14 +22,14 @@ Created: 2025-12-14 (P2-001)
 """
 
 import argparse
-import json
+import mmap
 import os
-import re
-import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import json_compat
 
 
 # =============================================================================
@@ -55,26 +55,124 @@ RULES = {
     "max_bundle_size_kb": 60,
 }
 
+# Directories never descended into when scanning source files
+# (VCS metadata, dependencies, virtualenvs, caches and build output)
+EXCLUDED_DIRS = {
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".svelte-kit",
+    "dist",
+    "build",
+    "coverage",
+}
+
+# Byte markers for the data-testid check
+TESTID_MARKER = b"data-testid"
+INTERACTIVE_MARKERS = (b"<button", b"<input", b"<form", b"on:click")
+
+# Line counting: files this large are mmap'd and scanned in slices
+MMAP_MIN_SIZE = 1_000_000
+MMAP_SLICE_SIZE = 1 << 20
+
+# Line limit per source suffix (.svelte gets the higher limit)
+FILE_LINE_LIMITS = {
+    "py": RULES["max_file_lines"],
+    "ts": RULES["max_file_lines"],
+    "svelte": RULES["max_svelte_lines"],
+}
+
 
-@dataclass
 class RuleCheck:
-    """Result of a single rule check."""
-    rule_id: str
-    category: str
-    description: str
-    passed: bool
-    value: str = ""
-    threshold: str = ""
-    details: List[str] = field(default_factory=list)
+    """
+    Result of a single rule check.
+
+    Uses __slots__ (no per-instance __dict__) and an empty tuple for
+    details, so checks without details allocate nothing extra.
+    """
+    __slots__ = ("rule_id", "category", "description", "passed", "value", "threshold", "details")
+
+    def __init__(
+        self,
+        rule_id: str,
+        category: str,
+        description: str,
+        passed: bool,
+        value: str = "",
+        threshold: str = "",
+        details: Sequence[str] = (),
+    ):
+        self.rule_id = rule_id
+        self.category = category
+        self.description = description
+        self.passed = passed
+        self.value = value
+        self.threshold = threshold
+        self.details = details
 
 
-@dataclass
 class CheckResult:
     """Aggregated check results."""
-    checks: List[RuleCheck] = field(default_factory=list)
-    passed: int = 0
-    failed: int = 0
-    skipped: int = 0
+    __slots__ = ("checks", "passed", "failed", "skipped")
+
+    def __init__(self):
+        self.checks: List[RuleCheck] = []
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+
+
+# =============================================================================
+# REPO INDEX
+# =============================================================================
+
+@dataclass
+class RepoIndex:
+    """Source files collected by one walk, shared by all checks in a run."""
+    py_files: List[str] = field(default_factory=list)
+    ts_files: List[str] = field(default_factory=list)
+    svelte_files: List[str] = field(default_factory=list)
+
+    def by_suffix(self, suffix: str) -> List[str]:
+        """Files for a FILE_LINE_LIMITS suffix."""
+        return getattr(self, f"{suffix}_files")
+
+
+def _iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Walk root once with os.scandir, pruning EXCLUDED_DIRS before descent."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def build_repo_index(root: Path = PROJECT_ROOT) -> RepoIndex:
+    """Walk the repo once and bucket source files by suffix."""
+    index = RepoIndex()
+    for entry in _iter_files(root):
+        suffix = os.path.splitext(entry.name)[1][1:]
+        if suffix in FILE_LINE_LIMITS:
+            index.by_suffix(suffix).append(entry.path)
+    return index
+
+
+def _under(path: str, directory: Path) -> bool:
+    """True if path lies inside directory."""
+    return path.startswith(str(directory) + os.sep)
 
 
 # =============================================================================
@@ -94,7 +192,7 @@ def check_coverage(result: CheckResult) -> None:
         if cov_file.exists():
             try:
                 if cov_file.suffix == ".json":
-                    data = json.loads(cov_file.read_text())
+                    data = json_compat.loads(cov_file.read_bytes())
                     if "total" in data:
                         pct = data["total"].get("lines", {}).get("pct", 0)
                         check = RuleCheck(
@@ -128,42 +226,69 @@ def check_coverage(result: CheckResult) -> None:
     result.skipped += 1
 
 
-def check_file_sizes(result: CheckResult) -> None:
+def _count_lines(path: str) -> int:
+    """
+    Count lines by scanning raw bytes for newlines (no decode).
+
+    Files at or above MMAP_MIN_SIZE are mapped and scanned in page-cache
+    slices; smaller files are read in one call since mmap setup costs
+    more than it saves there.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        if size < MMAP_MIN_SIZE:
+            data = f.read()
+            count = data.count(b"\n")
+            last = data[-1:]
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                count = sum(
+                    mm[pos:pos + MMAP_SLICE_SIZE].count(b"\n")
+                    for pos in range(0, size, MMAP_SLICE_SIZE)
+                )
+                last = mm[-1:]
+    # Match str.splitlines(): an unterminated last line still counts
+    if last and last != b"\n":
+        count += 1
+    return count
+
+
+def _safe_count_lines(path: str) -> Optional[int]:
+    """_count_lines that returns None for unreadable files."""
+    try:
+        return _count_lines(path)
+    except OSError:
+        return None
+
+
+def check_file_sizes(result: CheckResult, index: Optional[RepoIndex] = None) -> None:
     """Check file size limits."""
-    violations = []
+    index = index or build_repo_index()
+    by_suffix = {suffix: [] for suffix in FILE_LINE_LIMITS}
 
-    # Check Python files
-    for py_file in PROJECT_ROOT.glob("**/*.py"):
-        if "node_modules" in str(py_file) or ".venv" in str(py_file) or "venv" in str(py_file):
-            continue
-        try:
-            lines = len(py_file.read_text().splitlines())
-            if lines > RULES["max_file_lines"]:
-                violations.append(f"{py_file.relative_to(PROJECT_ROOT)}: {lines} lines")
-        except Exception:
-            pass
+    candidates = [
+        (path, suffix)
+        for suffix in FILE_LINE_LIMITS
+        for path in index.by_suffix(suffix)
+    ]
 
-    # Check TypeScript files
-    for ts_file in PROJECT_ROOT.glob("**/*.ts"):
-        if "node_modules" in str(ts_file):
-            continue
-        try:
-            lines = len(ts_file.read_text().splitlines())
-            if lines > RULES["max_file_lines"]:
-                violations.append(f"{ts_file.relative_to(PROJECT_ROOT)}: {lines} lines")
-        except Exception:
-            pass
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Check Svelte files (higher limit)
-    for svelte_file in PROJECT_ROOT.glob("**/*.svelte"):
-        if "node_modules" in str(svelte_file):
-            continue
-        try:
-            lines = len(svelte_file.read_text().splitlines())
-            if lines > RULES["max_svelte_lines"]:
-                violations.append(f"{svelte_file.relative_to(PROJECT_ROOT)}: {lines} lines (svelte)")
-        except Exception:
-            pass
+    # File reads release the GIL, so overlap them across threads
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(_safe_count_lines, [path for path, _ in candidates])
+
+        for (path, suffix), lines in zip(candidates, counts):
+            if lines is not None and lines > FILE_LINE_LIMITS[suffix]:
+                rel = os.path.relpath(path, PROJECT_ROOT)
+                label = " (svelte)" if suffix == "svelte" else ""
+                by_suffix[suffix].append(f"{rel}: {lines} lines{label}")
+
+    # Report Python, then TypeScript, then Svelte
+    violations = [v for suffix in FILE_LINE_LIMITS for v in by_suffix[suffix]]
 
     check = RuleCheck(
         rule_id="R-SIZE-001",
@@ -183,18 +308,21 @@ def check_file_sizes(result: CheckResult) -> None:
 
 def check_git_checkpoint(result: CheckResult) -> None:
     """Check if git checkpoint exists for current phase."""
+    import subprocess
+
     os.chdir(PROJECT_ROOT)
 
     try:
-        # Get recent commits with "Phase" in message
+        # Only the last 20 subjects count. git log --grep would search every
+        # commit (and message bodies) until 20 matches, so filter here.
         proc = subprocess.run(
             ["git", "log", "--oneline", "-20"],
             capture_output=True,
             text=True,
         )
-        commits = proc.stdout.strip().split("\n")
-
-        phase_commits = [c for c in commits if "Phase" in c and "Complete" in c]
+        phase_commits = [
+            c for c in proc.stdout.splitlines() if "Phase" in c and "Complete" in c
+        ]
 
         check = RuleCheck(
             rule_id="R-GIT-001",
@@ -264,18 +392,25 @@ def check_pre_commit_hook(result: CheckResult) -> None:
     """Check pre-commit hook is installed."""
     hook_path = PROJECT_ROOT / ".git" / "hooks" / "pre-commit"
 
+    # One stat answers both "exists" and "executable"
+    try:
+        st = os.stat(hook_path)
+        exists = True
+        executable = bool(st.st_mode & 0o111)
+    except FileNotFoundError:
+        exists = False
+        executable = False
+
     check = RuleCheck(
         rule_id="R-HOOK-001",
         category="gates",
         description="Pre-commit hook installed",
-        passed=hook_path.exists() and os.access(hook_path, os.X_OK),
-        value="Installed" if hook_path.exists() else "Missing",
+        passed=exists and executable,
+        value="Installed" if exists else "Missing",
         threshold="Installed and executable",
+        details=("Hook exists but is not executable",) if exists and not executable else (),
     )
 
-    if hook_path.exists() and not os.access(hook_path, os.X_OK):
-        check.details.append("Hook exists but is not executable")
-
     result.checks.append(check)
     if check.passed:
         result.passed += 1
@@ -283,15 +418,28 @@ def check_pre_commit_hook(result: CheckResult) -> None:
         result.failed += 1
 
 
-def check_test_files(result: CheckResult) -> None:
+def check_test_files(result: CheckResult, index: Optional[RepoIndex] = None) -> None:
     """Check test file existence."""
-    frontend_tests = list((PROJECT_ROOT / "frontend").glob("**/*.test.ts"))
-    e2e_tests = list((PROJECT_ROOT / "frontend").glob("**/e2e/**/*.spec.ts"))
-    backend_tests = list((PROJECT_ROOT / "backend").glob("**/test_*.py"))
-
-    # Filter out node_modules
-    frontend_tests = [f for f in frontend_tests if "node_modules" not in str(f)]
-    e2e_tests = [f for f in e2e_tests if "node_modules" not in str(f)]
+    index = index or build_repo_index()
+    frontend_root = PROJECT_ROOT / "frontend"
+    backend_root = PROJECT_ROOT / "backend"
+
+    frontend_tests = []
+    e2e_tests = []
+    for path in index.ts_files:
+        if not _under(path, frontend_root):
+            continue
+        if path.endswith(".test.ts"):
+            frontend_tests.append(path)
+        if path.endswith(".spec.ts"):
+            parent_dirs = Path(os.path.relpath(path, frontend_root)).parts[:-1]
+            if "e2e" in parent_dirs:
+                e2e_tests.append(path)
+
+    backend_tests = [
+        path for path in index.py_files
+        if _under(path, backend_root) and os.path.basename(path).startswith("test_")
+    ]
 
     check = RuleCheck(
         rule_id="R-TEST-001",
@@ -308,22 +456,26 @@ def check_test_files(result: CheckResult) -> None:
         result.failed += 1
 
 
-def check_data_testid(result: CheckResult) -> None:
+def check_data_testid(result: CheckResult, index: Optional[RepoIndex] = None) -> None:
     """Check for data-testid attributes in Svelte components."""
-    svelte_files = list((PROJECT_ROOT / "frontend").glob("**/*.svelte"))
-    svelte_files = [f for f in svelte_files if "node_modules" not in str(f)]
+    index = index or build_repo_index()
+    frontend_root = PROJECT_ROOT / "frontend"
+    svelte_files = [
+        Path(path) for path in index.svelte_files if _under(path, frontend_root)
+    ]
 
     files_with_testid = 0
     files_without = []
 
     for svelte_file in svelte_files:
         try:
-            content = svelte_file.read_text()
-            if "data-testid" in content:
+            # Markers are ASCII, so scan raw bytes and skip UTF-8 decoding
+            content = svelte_file.read_bytes()
+            if TESTID_MARKER in content:
                 files_with_testid += 1
             else:
                 # Only report components with interactive elements
-                if any(tag in content for tag in ["<button", "<input", "<form", "on:click"]):
+                if any(tag in content for tag in INTERACTIVE_MARKERS):
                     files_without.append(str(svelte_file.relative_to(PROJECT_ROOT)))
         except Exception:
             pass
@@ -362,7 +514,7 @@ def check_pm_state(result: CheckResult) -> None:
         return
 
     try:
-        data = json.loads(pm_state_file.read_text())
+        data = json_compat.loads(pm_state_file.read_bytes())
         required_fields = ["current_stage", "current_phase", "phase_status"]
         missing = [f for f in required_fields if f not in data]
 
@@ -381,7 +533,7 @@ def check_pm_state(result: CheckResult) -> None:
         else:
             result.failed += 1
 
-    except json.JSONDecodeError:
+    except json_compat.JSONDecodeError:
         check = RuleCheck(
             rule_id="R-PM-001",
             category="gates",
@@ -398,18 +550,42 @@ def check_pm_state(result: CheckResult) -> None:
 # MAIN
 # =============================================================================
 
-def run_all_checks() -> CheckResult:
-    """Run all rule checks."""
+# (category, check function, needs RepoIndex) in report order
+CHECKS = [
+    ("coverage", check_coverage, False),
+    ("code-quality", check_file_sizes, True),
+    ("git", check_git_checkpoint, False),
+    ("gates", check_gate_records, False),
+    ("gates", check_pre_commit_hook, False),
+    ("testing", check_test_files, True),
+    ("testing", check_data_testid, True),
+    ("gates", check_pm_state, False),
+]
+
+CATEGORIES = sorted({category for category, _, _ in CHECKS})
+
+
+def run_all_checks(category: Optional[str] = None) -> CheckResult:
+    """
+    Run all rule checks, or only those in one category.
+
+    The repo walk happens only if a selected check needs it, so e.g.
+    --category git never touches the source tree.
+    """
     result = CheckResult()
+    selected = [
+        (check_fn, needs_index)
+        for check_category, check_fn, needs_index in CHECKS
+        if category is None or check_category == category
+    ]
+
+    index = build_repo_index() if any(needs_index for _, needs_index in selected) else None
 
-    check_coverage(result)
-    check_file_sizes(result)
-    check_git_checkpoint(result)
-    check_gate_records(result)
-    check_pre_commit_hook(result)
-    check_test_files(result)
-    check_data_testid(result)
-    check_pm_state(result)
+    for check_fn, needs_index in selected:
+        if needs_index:
+            check_fn(result, index)
+        else:
+            check_fn(result)
 
     return result
 
@@ -456,13 +632,13 @@ def print_results(result: CheckResult) -> None:
 
 def main():
     parser = argparse.ArgumentParser(description="CLAUDE.md Rules Checker")
-    parser.add_argument("--category", help="Run specific category only")
+    parser.add_argument("--category", choices=CATEGORIES, help="Run specific category only")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
 
     os.chdir(PROJECT_ROOT)
-    result = run_all_checks()
+    result = run_all_checks(args.category)
 
     if args.json:
         output = {
@@ -477,12 +653,12 @@ def main():
                     "passed": c.passed,
                     "value": c.value,
                     "threshold": c.threshold,
-                    "details": c.details,
+                    "details": list(c.details),
                 }
                 for c in result.checks
             ],
         }
-        print(json.dumps(output, indent=2))
+        print(json_compat.dumps(output, indent=True))
     else:
         print_results(result)
 
@@ -15,10 +15,14 @@ Created: 2025-12-14 (TD-S5-004)
 """
 
 import json
+import os
 import sys
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+from md_buffer import MarkdownBuffer
+
 
 # =============================================================================
 # CONFIGURATION
@@ -32,17 +36,23 @@ GATES_DIR = Path(".claude-bus/gates")
 def get_next_session_number() -> int:
     """Get next session number for today."""
     today = datetime.now().strftime("%Y-%m-%d")
-    existing = list(HANDOFFS_DIR.glob(f"session-{today}-*.md"))
-    if not existing:
+    prefix = f"session-{today}-"
+    highest = 0
+    try:
+        with os.scandir(HANDOFFS_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(".md")):
+                    continue
+                try:
+                    num = int(name[:-3].rsplit("-", 1)[-1])
+                except ValueError:
+                    continue
+                if num > highest:
+                    highest = num
+    except (FileNotFoundError, NotADirectoryError):
         return 1
-    numbers = []
-    for f in existing:
-        try:
-            num = int(f.stem.split("-")[-1])
-            numbers.append(num)
-        except ValueError:
-            continue
-    return max(numbers) + 1 if numbers else 1
+    return highest + 1
 
 
 def read_pm_state() -> dict:
@@ -57,22 +67,31 @@ def read_pm_state() -> dict:
 
 def get_latest_gate_info() -> dict:
     """Get info from latest gate record."""
-    if not GATES_DIR.exists():
-        return {}
-
     latest_gate = None
     latest_time = None
 
-    for stage_dir in GATES_DIR.glob("stage*"):
-        for gate_file in stage_dir.glob("phase*-*-gate*.md"):
-            mtime = gate_file.stat().st_mtime
-            if latest_time is None or mtime > latest_time:
-                latest_time = mtime
-                latest_gate = gate_file
+    try:
+        with os.scandir(GATES_DIR) as stage_entries:
+            stage_dirs = [
+                e.path for e in stage_entries
+                if e.name.startswith("stage") and e.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+    for stage_dir in stage_dirs:
+        with os.scandir(stage_dir) as gate_entries:
+            for entry in gate_entries:
+                if not fnmatchcase(entry.name, "phase*-*-gate*.md") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_time is None or mtime > latest_time:
+                    latest_time = mtime
+                    latest_gate = entry.path
 
     if latest_gate:
         return {
-            "file": str(latest_gate),
+            "file": latest_gate,
             "modified": datetime.fromtimestamp(latest_time).isoformat()
         }
     return {}
@@ -83,7 +102,8 @@ def create_handoff(
     notes: str = "",
     decisions: list = None,
     next_actions: list = None,
-    blockers: list = None
+    blockers: list = None,
+    pm_state: dict = None
 ) -> str:
     """
     Create a handoff document.
@@ -94,6 +114,7 @@ def create_handoff(
         decisions: List of decisions made this session
         next_actions: List of recommended next actions
         blockers: List of current blockers
+        pm_state: Already-loaded PM state (read from disk when omitted)
 
     Returns:
         Path to created handoff file
@@ -105,104 +126,73 @@ def create_handoff(
     filename = f"session-{today}-{session_num:02d}.md"
     filepath = HANDOFFS_DIR / filename
 
-    pm_state = read_pm_state()
+    if pm_state is None:
+        pm_state = read_pm_state()
     gate_info = get_latest_gate_info()
 
     # Build content
-    lines = [
-        f"# Session Handoff: {today} #{session_num:02d}",
-        "",
-        f"**Created**: {datetime.now().isoformat()}Z",
-        f"**Trigger**: {trigger}",
-        "",
-        "---",
-        "",
-        "## Current State",
-        "",
-        f"- **Stage**: {pm_state.get('current_stage', 'Unknown')}",
-        f"- **Phase**: {pm_state.get('current_phase', 'Unknown')}",
-        f"- **Status**: {pm_state.get('phase_status', 'Unknown')}",
-        "",
-    ]
+    buf = MarkdownBuffer()
+    write, line, section = buf.write, buf.line, buf.section
+
+    line(f"# Session Handoff: {today} #{session_num:02d}")
+    line()
+    line(f"**Created**: {datetime.now().isoformat()}Z")
+    line(f"**Trigger**: {trigger}")
+    line()
+    section("## Current State")
+    line(f"- **Stage**: {pm_state.get('current_stage', 'Unknown')}")
+    line(f"- **Phase**: {pm_state.get('current_phase', 'Unknown')}")
+    line(f"- **Status**: {pm_state.get('phase_status', 'Unknown')}")
+    line()
 
     if gate_info:
-        lines.extend([
-            f"- **Latest Gate**: `{gate_info.get('file', 'Unknown')}`",
-            f"- **Gate Modified**: {gate_info.get('modified', 'Unknown')}",
-            "",
-        ])
+        line(f"- **Latest Gate**: `{gate_info.get('file', 'Unknown')}`")
+        line(f"- **Gate Modified**: {gate_info.get('modified', 'Unknown')}")
+        line()
 
     if notes:
-        lines.extend([
-            "---",
-            "",
-            "## Session Notes",
-            "",
-            notes,
-            "",
-        ])
+        section("## Session Notes")
+        line(notes)
+        line()
 
     if decisions:
-        lines.extend([
-            "---",
-            "",
-            "## Decisions Made This Session",
-            "",
-            *[f"- {d}" for d in decisions],
-            "",
-        ])
+        section("## Decisions Made This Session")
+        buf.writelines(f"- {d}\n" for d in decisions)
+        line()
 
     if blockers:
-        lines.extend([
-            "---",
-            "",
-            "## Current Blockers",
-            "",
-            *[f"- ❌ {b}" for b in blockers],
-            "",
-        ])
+        section("## Current Blockers")
+        buf.writelines(f"- ❌ {b}\n" for b in blockers)
+        line()
 
     if next_actions:
-        lines.extend([
-            "---",
-            "",
-            "## Recommended Next Actions",
-            "",
-            *[f"{i+1}. {a}" for i, a in enumerate(next_actions)],
-            "",
-        ])
+        section("## Recommended Next Actions")
+        buf.writelines(f"{i+1}. {a}\n" for i, a in enumerate(next_actions))
+        line()
 
     # Add pending actions from PM state
     if pm_state.get("pending_actions"):
-        lines.extend([
-            "---",
-            "",
-            "## Pending Actions (from PM State)",
-            "",
-            *[f"- [{a.get('priority', 'medium').upper()}] {a.get('description', a)}"
-              for a in pm_state["pending_actions"]],
-            "",
-        ])
+        section("## Pending Actions (from PM State)")
+        buf.writelines(
+            f"- [{a.get('priority', 'medium').upper()}] {a.get('description', a)}\n"
+            for a in pm_state["pending_actions"]
+        )
+        line()
 
     # Add tech debt
     if pm_state.get("tech_debt"):
-        lines.extend([
-            "---",
-            "",
-            "## Tech Debt",
-            "",
-            *[f"- {td.get('id', '?')}: {td.get('description', '?')} ({td.get('severity', '?')})"
-              for td in pm_state["tech_debt"]],
-            "",
-        ])
-
-    lines.extend([
-        "---",
-        "",
-        "*This handoff was auto-generated. Edit as needed.*",
-    ])
-
-    content = "\n".join(lines)
+        section("## Tech Debt")
+        buf.writelines(
+            f"- {td.get('id', '?')}: {td.get('description', '?')} ({td.get('severity', '?')})\n"
+            for td in pm_state["tech_debt"]
+        )
+        line()
+
+    line("---")
+    line()
+    write("*This handoff was auto-generated. Edit as needed.*")
+
+    content = buf.getvalue()
     filepath.write_text(content, encoding="utf-8")
 
     return str(filepath)
@@ -257,7 +247,8 @@ def main():
         trigger=trigger,
         notes=notes,
         blockers=blockers if blockers else None,
-        next_actions=next_actions if next_actions else None
+        next_actions=next_actions if next_actions else None,
+        pm_state=pm_state
     )
 
     print(f"✅ Handoff created: {filepath}")
@@ -19,6 +19,7 @@ from typing import List
 
 MIN_SUMMARY_LENGTH = 50  # Minimum characters for agent summaries
 MAX_FILE_SIZE = 1_000_000  # 1 MB max file size
+MMAP_THRESHOLD = 64 * 1024  # Larger gate records are mmap'd, not read
 
 # Required agents for gate validation (G-001)
 REQUIRED_AGENTS = [
@@ -9,57 +9,82 @@ Created: 2025-12-14
 """
 
 import json
+import sys
 from datetime import datetime
+from typing import Dict, Sequence
 
 from gate_config import ValidationResult
 
 
+# =============================================================================
+# BOX CHROME
+# =============================================================================
+
+_BAR = "═" * 58
+_BOX_TOP = f"╔{_BAR}╗"
+_BOX_MID = f"╠{_BAR}╣"
+_BOX_BOT = f"╚{_BAR}╝"
+_EMPTY = "║" + " " * 58 + "║"
+_TITLE_ROW = "║  Gate Validation Check (Layer 3)   " + " " * 21 + "║"
+_CLEAN_ROW = "║  ✅ No errors or warnings found" + " " * 26 + "║"
+_VALID_ROW = "║  Result: ✅ VALID - Gate record passes validation" + " " * 7 + "║"
+_INVALID_ROW = "║  Result: ❌ INVALID - Fix errors before proceeding" + " " * 6 + "║"
+
+
 def print_result(result: ValidationResult, file_path: str) -> None:
     """Print validation result in formatted box output."""
-    print()
-    print("╔" + "═" * 58 + "╗")
-    print("║  Gate Validation Check (Layer 3)   " + " " * 21 + "║")
-    print("╠" + "═" * 58 + "╣")
-    print(f"║  File: {file_path[:48]:<48}  ║")
-    print("╠" + "═" * 58 + "╣")
+    lines = ["", _BOX_TOP, _TITLE_ROW, _BOX_MID, f"║  File: {file_path[:48]:<48}  ║", _BOX_MID]
+    add = lines.append
 
     if result.errors:
-        print(f"║  ❌ ERRORS ({len(result.errors)}):" + " " * (44 - len(str(len(result.errors)))) + "║")
+        add(f"║  ❌ ERRORS ({len(result.errors)}):".ljust(59) + "║")
         for error in result.errors:
-            wrapped = error[:52]
-            print(f"║  - {wrapped:<54}║")
+            add(f"║  - {error[:52]:<54}║")
             if len(error) > 52:
-                wrapped2 = error[52:104]
-                print(f"║    {wrapped2:<54}║")
-        print("║" + " " * 58 + "║")
+                add(f"║    {error[52:104]:<54}║")
+        add(_EMPTY)
 
     if result.warnings:
-        print(f"║  ⚠️  WARNINGS ({len(result.warnings)}):" + " " * (40 - len(str(len(result.warnings)))) + "║")
+        add(f"║  ⚠️  WARNINGS ({len(result.warnings)}):".ljust(59) + "║")
         for warning in result.warnings:
-            wrapped = warning[:52]
-            print(f"║  - {wrapped:<54}║")
-        print("║" + " " * 58 + "║")
+            add(f"║  - {warning[:52]:<54}║")
+        add(_EMPTY)
 
     if not result.errors and not result.warnings:
-        print("║  ✅ No errors or warnings found" + " " * 26 + "║")
-        print("║" + " " * 58 + "║")
-
-    print("╠" + "═" * 58 + "╣")
+        add(_CLEAN_ROW)
+        add(_EMPTY)
 
-    if result.valid:
-        print("║  Result: ✅ VALID - Gate record passes validation" + " " * 7 + "║")
-    else:
-        print("║  Result: ❌ INVALID - Fix errors before proceeding" + " " * 6 + "║")
+    add(_BOX_MID)
+    add(_VALID_ROW if result.valid else _INVALID_ROW)
+    add(_BOX_BOT)
+    add("")
 
-    print("╚" + "═" * 58 + "╝")
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def print_json_result(result: ValidationResult, file_path: str) -> None:
-    """Print validation result as JSON for CI/CD integration."""
-    output = {
+def _json_output(result: ValidationResult, file_path: str) -> Dict:
+    """Build the JSON object reported for one gate record."""
+    return {
         "file": file_path,
         "timestamp": datetime.utcnow().isoformat() + "Z",
         **result.to_dict()
     }
+
+
+def print_json_result(result: ValidationResult, file_path: str) -> None:
+    """Print validation result as JSON for CI/CD integration."""
+    print(json.dumps(_json_output(result, file_path), indent=2))
+
+
+def print_json_results(results: Sequence[ValidationResult], file_paths: Sequence[str]) -> None:
+    """
+    Print results for several files as one JSON document.
+
+    A single file prints the same object as print_json_result; several
+    files print one array of those objects, so the output always parses.
+    """
+    if len(results) == 1:
+        print_json_result(results[0], file_paths[0])
+        return
+    output = [_json_output(r, p) for r, p in zip(results, file_paths)]
     print(json.dumps(output, indent=2))
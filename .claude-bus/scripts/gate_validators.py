@@ -4,14 +4,25 @@ Gate Validation Functions - Defense in Depth Layer 3
 
 Contains all validation functions for gate record checking.
 
+Native build (optional):
+    This module and gate_config.py are kept mypyc-clean: fully annotated,
+    with regexes and lookup tables as module-level constants. Running
+    `mypyc gate_validators.py gate_config.py` in this directory produces
+    extension modules that Python imports in place of the .py files.
+    Delete the built *.so files after editing either source.
+
 Author: PM-Architect-Agent
 Created: 2025-12-14
 """
 
+import mmap
+import os
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple, Union
 
 from gate_config import (
     ValidationResult,
@@ -22,43 +33,294 @@ from gate_config import (
     VALID_SIGNOFF_VALUES,
     MIN_SUMMARY_LENGTH,
     MAX_FILE_SIZE,
+    MMAP_THRESHOLD,
 )
+from git_cache import object_exists
 
 
 # =============================================================================
-# FILE OPERATIONS
+# COMPILED PATTERNS
 # =============================================================================
 
-def read_file(file_path: str) -> str:
-    """Read gate record file with error handling."""
-    path = Path(file_path)
+_STAGE_RE = re.compile(r"\*\*Stage\*\*:\s*(\d+)")
+_PHASE_RE = re.compile(r"\*\*Phase\*\*:\s*(\d+)")
+_GATE_TYPE_RE = re.compile(r"\*\*Gate Type\*\*:\s*(Input|Output)")
+_DATE_RE = re.compile(r"\*\*Date\*\*:\s*(\d{4}-\d{2}-\d{2})")
+_GATE_STATUS_RE = re.compile(
+    r"\*\*Status\*\*:\s*(PENDING|PASS(?:ED)?(?:\s*\([^)]+\))?|FAIL(?:ED)?)", re.IGNORECASE
+)
+_INVOCATION_TS_RE = re.compile(
+    r"\*\*Invocation Timestamp\*\*:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"
+)
+_VALIDATION_TS_RE = re.compile(
+    r"\*\*Validation Timestamp\*\*:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"
+)
+_VALIDATION_TS_PREFIX_RE = re.compile(r"\*\*Validation Timestamp\*\*:\s*\d{4}-\d{2}-\d{2}T")
+_VALIDATION_RESULT_RE = re.compile(r"\*\*Validation Result\*\*:\s*(VALID|INVALID)")
+_STATUS_RE = re.compile(r"\*\*Status\*\*:\s*(\w+)")
+_CONCERN_STATUS_RE = re.compile(r"\*\*Status\*\*:\s*(CONCERN|QUESTION)")
+_SUMMARY_RE = re.compile(r"\*\*Summary\*\*.*?:\s*\n(.+?)(?=\*\*Checklist|\n\n|$)", re.DOTALL)
+_TABLE_ROW_RE = re.compile(r"\|\s*\d+\s*\|[^|]+\|[^|]+\|[^|]+\|[^|]+\|")
+_CHECKLIST_CELL_RE = re.compile(r"\|\s*\d+\s*\|([^|]+)\|")
+_TOTAL_ITEMS_RE = re.compile(r"\*\*Total Items\*\*:\s*\d+")
+_DECISION_RE = re.compile(r"\*\*Decision\*\*:\s*(\w+)")
+_PM_SIGNOFF_RE = re.compile(r"\|\s*PM-Architect-Agent\s*\|\s*(APPROVED|REJECTED|CONDITIONAL)\s*\|")
+_PM_REJECTED_RE = re.compile(r"\|\s*PM-Architect-Agent\s*\|\s*REJECTED\s*\|")
+_SIGNOFF_AGENT_RE = re.compile(
+    r"\|\s*([^|]+Agent[^|]*)\s*\|\s*(?:APPROVED|REJECTED|CONDITIONAL|N/A)\s*\|"
+)
+_PLACEHOLDER_RE = re.compile(r"\[REQUIRED[^\]]*\]")
+_COMMIT_HASH_RE = re.compile(r"^[a-f0-9]{7,40}$")
+
+# Common patterns: "Commit:", "Git Checkpoint:", "Hash:", or raw commit hashes.
+# One alternation scans the content once; groups are listed in priority order
+# and the highest-priority group seen anywhere in the document wins. The
+# pattern is written in lowercase and run case-sensitively over lowercased
+# content, which is cheaper than an IGNORECASE scan.
+_COMMIT_GROUPS = ("gc", "c", "cl", "st")
+_COMMIT_RE = re.compile(
+    r"\*\*git checkpoint\*\*:\s*(?P<gc>[a-f0-9]{7,40})"
+    r"|\*\*commit\*\*:\s*(?P<c>[a-f0-9]{7,40})"
+    r"|commit[:\s]+(?P<cl>[a-f0-9]{7,40})"
+    r"|\b(?P<st>[a-f0-9]{7,40})\s+stage"  # "abc1234 Stage 5 Phase 2 Complete"
+)
+# For content whose lowercase form changes length (offsets would not line up)
+_COMMIT_ICASE_RE = re.compile(_COMMIT_RE.pattern, re.IGNORECASE)
+
+# Section headers; Section N runs until the Section N+1 header (Section 7
+# until Document History) or end of file
+_SECTION_HEADERS = {
+    1: "## Section 1: Agent Invocation Evidence",
+    2: "## Section 2: Agent Responses",
+    3: "## Section 3: Consolidated Checklist",
+    4: "## Section 4: Unresolved Issues",
+    5: "## Section 5: Sign-offs",
+    6: "## Section 6: Gate Decision",
+    7: "## Section 7: Validation",
+}
+_SECTION_END_MARKERS = {n: f"## Section {n + 1}:" for n in range(1, 7)}
+_SECTION_END_MARKERS[7] = "## Document History"
+
+# Per-agent sign-off patterns, built once per REQUIRED_AGENTS entry
+_AGENT_SIGNOFF_RES = {
+    agent: re.compile(rf"\|\s*{re.escape(agent)}\s*\|\s*(APPROVED|REJECTED|CONDITIONAL|N/A)\s*\|")
+    for agent in REQUIRED_AGENTS
+}
+
+# Known sign-off names for the fabrication check
+_KNOWN_AGENTS = frozenset(REQUIRED_AGENTS + ["PM-Architect-Agent"])
+_KNOWN_AGENTS_RE = re.compile("|".join(re.escape(a) for a in sorted(_KNOWN_AGENTS)))
+_KNOWN_AGENTS_JOINED = "|".join(sorted(_KNOWN_AGENTS))
 
-    if not path.exists():
-        raise FileNotFoundError(f"Gate record not found: {file_path}")
 
-    file_size = path.stat().st_size
-    if file_size > MAX_FILE_SIZE:
-        raise ValueError(f"File too large: {file_size} bytes (max {MAX_FILE_SIZE})")
+# =============================================================================
+# FILE OPERATIONS
+# =============================================================================
 
+def _decode_utf8(data: Union[bytes, mmap.mmap], file_path: Union[str, Path]) -> str:
     try:
-        content = path.read_text(encoding="utf-8")
+        return str(data, "utf-8")
     except UnicodeDecodeError as e:
         raise ValueError(f"File encoding error: {file_path} is not valid UTF-8. Error: {e}")
 
+
+def _too_large(size: int) -> ValueError:
+    return ValueError(f"File too large: {size} bytes (max {MAX_FILE_SIZE})")
+
+
+def _read_utf8(f: BinaryIO, file_path: Union[str, Path]) -> str:
+    """
+    Decode an open gate record, bounded by MAX_FILE_SIZE.
+
+    Typical records fit in one MMAP_THRESHOLD read. Larger files are mapped
+    and decoded straight from the page cache, skipping the intermediate
+    bytes copy; files that cannot be mapped (pipes) are read instead.
+    """
+    head = f.read(MMAP_THRESHOLD)
+    if len(head) < MMAP_THRESHOLD:
+        return _decode_utf8(head, file_path)
+
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        data = head + f.read(MAX_FILE_SIZE + 1 - len(head))
+        if len(data) > MAX_FILE_SIZE:
+            raise _too_large(os.fstat(f.fileno()).st_size)
+        return _decode_utf8(data, file_path)
+
+    with mapped:
+        if len(mapped) > MAX_FILE_SIZE:
+            raise _too_large(len(mapped))
+        return _decode_utf8(mapped, file_path)
+
+
+def read_file(file_path: Union[str, Path]) -> str:
+    """Read gate record file with error handling."""
+    try:
+        with open(file_path, "rb") as f:
+            content = _read_utf8(f, file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Gate record not found: {file_path}") from None
+
+    # Universal newlines, as text-mode reads did
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
     if not content.strip():
         raise ValueError(f"Gate record file is empty: {file_path}")
 
     return content
 
 
+# =============================================================================
+# SECTION SPLITTING
+# =============================================================================
+
+def split_sections(content: str) -> Dict[int, str]:
+    """
+    Split a gate record into its numbered sections.
+
+    Section N starts at its full "## Section N: <title>" header and ends
+    at the next "## Section N+1:" header (Section 7 at "## Document
+    History"), or at end of file when that header is absent. Headers are
+    literal, so str.find locates them without regex backtracking.
+
+    Returns:
+        Dict of section number -> section text, for sections that exist
+    """
+    sections: Dict[int, str] = {}
+    for number, header in _SECTION_HEADERS.items():
+        start = content.find(header)
+        if start == -1:
+            continue
+        end = content.find(_SECTION_END_MARKERS[number], start + len(header))
+        sections[number] = content[start:end] if end != -1 else content[start:]
+    return sections
+
+
+def _parse_invocation_table(section: str) -> Dict[str, str]:
+    """
+    Map agent name -> YES/NO from the Section 1 invocation table.
+
+    Walks table lines once; the first "| <agent> | YES|NO |" cell pair
+    per agent wins, as with a per-agent regex search.
+    """
+    table: Dict[str, str] = {}
+    for line in section.splitlines():
+        if "|" not in line:
+            continue
+        cells = line.split("|")
+        # cells[1:-1] are the pipe-delimited cells; pair each with its right neighbour
+        for i in range(1, len(cells) - 2):
+            value = cells[i + 1].strip()
+            if value == "YES" or value == "NO":
+                table.setdefault(cells[i].strip(), value)
+    return table
+
+
+def _parse_response_sections(section: str) -> Dict[str, str]:
+    """
+    Map agent name -> "### <agent> Response" block from Section 2.
+
+    Splits once on "###"; each block runs to the next "###" (or a stray
+    "## Section 3:" header), and the first block per agent wins.
+    """
+    responses: Dict[str, str] = {}
+    for chunk in section.split("###")[1:]:
+        chunk = chunk.lstrip("#")
+        if not chunk.startswith(" "):
+            continue
+        name, sep, _ = chunk[1:].partition(" Response")
+        if not sep or name in responses:
+            continue
+        end = chunk.find("## Section 3:")
+        responses[name] = "###" + (chunk if end == -1 else chunk[:end])
+    return responses
+
+
+# =============================================================================
+# GATE CONTEXT
+# =============================================================================
+
+@dataclass
+class GateContext:
+    """
+    Parsed view of one gate record, shared by all validators.
+
+    Sections and metadata are parsed on first access and cached, so
+    validators needing the same field do not each re-run its search.
+    """
+    content: str
+    file_path: Optional[Union[str, Path]] = None
+    now: datetime = field(default_factory=datetime.now)  # One clock reading per record
+
+    @cached_property
+    def one_year_ahead(self) -> datetime:
+        """Cut-off for the 1-year-ahead date check (ValueError on Feb 29)."""
+        return self.now.replace(year=self.now.year + 1)
+
+    @cached_property
+    def sections(self) -> Dict[int, str]:
+        """Section number -> section text (see split_sections)."""
+        return split_sections(self.content)
+
+    @cached_property
+    def stage(self) -> Optional[int]:
+        match = _STAGE_RE.search(self.content)
+        return int(match.group(1)) if match else None
+
+    @cached_property
+    def phase(self) -> Optional[int]:
+        match = _PHASE_RE.search(self.content)
+        return int(match.group(1)) if match else None
+
+    @cached_property
+    def gate_type(self) -> Optional[str]:
+        match = _GATE_TYPE_RE.search(self.content)
+        return match.group(1) if match else None
+
+    @cached_property
+    def date_text(self) -> Optional[str]:
+        """Raw **Date** value (YYYY-MM-DD), if present."""
+        match = _DATE_RE.search(self.content)
+        return match.group(1) if match else None
+
+    @cached_property
+    def date(self) -> Optional[datetime]:
+        """Parsed gate date; None when missing or not a real date."""
+        return _parse_or_none(self.date_text, "%Y-%m-%d")
+
+    @cached_property
+    def invocation_ts(self) -> Optional[datetime]:
+        """First **Invocation Timestamp** in the record, parsed."""
+        match = _INVOCATION_TS_RE.search(self.content)
+        return _parse_or_none(match.group(1) if match else None)
+
+    @cached_property
+    def validation_ts(self) -> Optional[datetime]:
+        """First **Validation Timestamp** in the record, parsed."""
+        match = _VALIDATION_TS_RE.search(self.content)
+        return _parse_or_none(match.group(1) if match else None)
+
+
+def _parse_or_none(text: Optional[str], fmt: Optional[str] = None) -> Optional[datetime]:
+    """Parse a date (strptime fmt) or ISO timestamp, returning None on failure."""
+    if text is None:
+        return None
+    try:
+        return datetime.strptime(text, fmt) if fmt else datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
 # =============================================================================
 # SECTION VALIDATORS
 # =============================================================================
 
-def check_required_sections(content: str, result: ValidationResult) -> None:
+def check_required_sections(ctx: GateContext, result: ValidationResult) -> None:
     """Check that all required sections are present."""
     for section in REQUIRED_SECTIONS:
-        if section not in content:
+        if section not in ctx.content:
             result.errors.append(
                 f"Missing required section: '{section}'. "
                 f"Copy from template: .claude-bus/templates/gate-validation-template.md"
@@ -67,53 +329,46 @@ def check_required_sections(content: str, result: ValidationResult) -> None:
             result.info.append(f"Found section: '{section}'")
 
 
-def check_metadata(content: str, result: ValidationResult) -> None:
+def check_metadata(ctx: GateContext, result: ValidationResult) -> None:
     """Check gate metadata fields."""
     # Check Stage
-    if not re.search(r"\*\*Stage\*\*:\s*\d+", content):
+    if ctx.stage is None:
         result.errors.append("Missing or invalid Stage number. Add: **Stage**: N")
 
     # Check Phase
-    if not re.search(r"\*\*Phase\*\*:\s*\d+", content):
+    if ctx.phase is None:
         result.errors.append("Missing or invalid Phase number. Add: **Phase**: N")
 
     # Check Gate Type
-    if not re.search(r"\*\*Gate Type\*\*:\s*(Input|Output)", content):
+    if ctx.gate_type is None:
         result.errors.append("Missing or invalid Gate Type. Add: **Gate Type**: Input or Output")
 
     # Check Date
-    date_match = re.search(r"\*\*Date\*\*:\s*(\d{4}-\d{2}-\d{2})", content)
-    if not date_match:
+    if ctx.date_text is None:
         result.errors.append("Missing or invalid Date. Add: **Date**: YYYY-MM-DD")
+    elif ctx.date is None:
+        result.errors.append(f"Invalid date format: {ctx.date_text}")
     else:
         try:
-            parsed_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-            if parsed_date > datetime.now().replace(year=datetime.now().year + 1):
-                result.warnings.append(f"Date {date_match.group(1)} is more than 1 year in future")
+            if ctx.date > ctx.one_year_ahead:
+                result.warnings.append(f"Date {ctx.date_text} is more than 1 year in future")
         except ValueError:
-            result.errors.append(f"Invalid date format: {date_match.group(1)}")
+            result.errors.append(f"Invalid date format: {ctx.date_text}")
 
     # Check Status - Support PASS/PASSED/PASS (with tech debt)
-    if not re.search(r"\*\*Status\*\*:\s*(PENDING|PASS(?:ED)?(?:\s*\([^)]+\))?|FAIL(?:ED)?)", content, re.IGNORECASE):
+    if not _GATE_STATUS_RE.search(ctx.content):
         result.errors.append("Missing or invalid Status. Add: **Status**: PENDING, PASS, or FAIL")
 
 
-def check_agent_invocation(content: str, result: ValidationResult) -> None:
+def check_agent_invocation(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 1: Agent Invocation Evidence."""
-    section_match = re.search(
-        r"## Section 1: Agent Invocation Evidence.*?(?=## Section 2:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(1)
+    if section is None:
         result.errors.append("Cannot parse Section 1: Agent Invocation Evidence")
         return
 
-    section = section_match.group(0)
-
     # Check timestamp
-    timestamp_match = re.search(
-        r"\*\*Invocation Timestamp\*\*:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})", section
-    )
+    timestamp_match = _INVOCATION_TS_RE.search(section)
     if not timestamp_match:
         result.errors.append("Missing Invocation Timestamp. Add: **Invocation Timestamp**: ISO 8601")
     else:
@@ -123,12 +378,12 @@ def check_agent_invocation(content: str, result: ValidationResult) -> None:
             result.errors.append(f"Invalid timestamp format: {timestamp_match.group(1)}")
 
     # Check agents
+    invocations = _parse_invocation_table(section)
     agents_invoked = 0
     for agent in REQUIRED_AGENTS:
-        agent_pattern = rf"\|\s*{re.escape(agent)}\s*\|\s*(YES|NO)\s*\|"
-        match = re.search(agent_pattern, section)
-        if match:
-            if match.group(1) == "YES":
+        invoked = invocations.get(agent)
+        if invoked is not None:
+            if invoked == "YES":
                 agents_invoked += 1
         else:
             result.errors.append(f"Agent '{agent}' not listed in invocation table")
@@ -143,31 +398,24 @@ def check_agent_invocation(content: str, result: ValidationResult) -> None:
         result.errors.append(f"Unchecked verification items in Section 1 ({unchecked} items)")
 
 
-def check_agent_responses(content: str, result: ValidationResult) -> List[str]:
+def check_agent_responses(ctx: GateContext, result: ValidationResult) -> List[str]:
     """Check Section 2: Agent Responses. Returns agents with concerns."""
-    section_match = re.search(
-        r"## Section 2: Agent Responses.*?(?=## Section 3:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(2)
+    if section is None:
         result.errors.append("Cannot parse Section 2: Agent Responses")
         return []
-
-    section = section_match.group(0)
     agents_with_concerns = []
+    responses = _parse_response_sections(section)
 
     for agent in REQUIRED_AGENTS:
-        agent_pattern = rf"### {re.escape(agent)} Response.*?(?=###|## Section 3:|$)"
-        agent_match = re.search(agent_pattern, section, re.DOTALL)
+        agent_section = responses.get(agent)
 
-        if not agent_match:
+        if agent_section is None:
             result.errors.append(f"Missing response section for '{agent}'")
             continue
 
-        agent_section = agent_match.group(0)
-
         # Check Status
-        status_match = re.search(r"\*\*Status\*\*:\s*(\w+)", agent_section)
+        status_match = _STATUS_RE.search(agent_section)
         if not status_match:
             result.errors.append(f"Missing Status for '{agent}'")
         elif status_match.group(1) not in VALID_AGENT_STATUSES:
@@ -176,10 +424,7 @@ def check_agent_responses(content: str, result: ValidationResult) -> List[str]:
             agents_with_concerns.append(agent)
 
         # Check Summary length
-        summary_match = re.search(
-            r"\*\*Summary\*\*.*?:\s*\n(.+?)(?=\*\*Checklist|\n\n|$)",
-            agent_section, re.DOTALL
-        )
+        summary_match = _SUMMARY_RE.search(agent_section)
         if summary_match:
             summary = summary_match.group(1).strip()
             if "[REQUIRED" in summary:
@@ -192,18 +437,13 @@ def check_agent_responses(content: str, result: ValidationResult) -> List[str]:
     return agents_with_concerns
 
 
-def check_consolidated_checklist(content: str, result: ValidationResult) -> None:
+def check_consolidated_checklist(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 3: Consolidated Checklist."""
-    section_match = re.search(
-        r"## Section 3: Consolidated Checklist.*?(?=## Section 4:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(3)
+    if section is None:
         result.errors.append("Cannot parse Section 3: Consolidated Checklist")
         return
-
-    section = section_match.group(0)
-    table_rows = re.findall(r"\|\s*\d+\s*\|[^|]+\|[^|]+\|[^|]+\|[^|]+\|", section)
+    table_rows = _TABLE_ROW_RE.findall(section)
 
     if not table_rows:
         result.warnings.append("No checklist items found in Section 3")
@@ -216,67 +456,49 @@ def check_consolidated_checklist(content: str, result: ValidationResult) -> None
             if not has_valid_source and "PM-Architect" not in row:
                 result.warnings.append(f"Checklist item #{i} may be missing source agent")
 
-    if not re.search(r"\*\*Total Items\*\*:\s*\d+", section):
+    if not _TOTAL_ITEMS_RE.search(section):
         result.errors.append("Missing Total Items count")
 
 
-def check_unresolved_issues(content: str, result: ValidationResult) -> None:
+def check_unresolved_issues(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 4: Unresolved Issues."""
-    section_match = re.search(
-        r"## Section 4: Unresolved Issues.*?(?=## Section 5:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(4)
+    if section is None:
         result.errors.append("Cannot parse Section 4: Unresolved Issues")
         return
-
-    section = section_match.group(0)
-    has_concerns = re.search(r'\*\*Status\*\*:\s*(CONCERN|QUESTION)', content)
-    issue_rows = re.findall(r'\|\s*\d+\s*\|[^|]+\|[^|]+\|[^|]+\|[^|]+\|', section)
+    has_concerns = _CONCERN_STATUS_RE.search(ctx.content)
+    issue_rows = _TABLE_ROW_RE.findall(section)
     has_issues = len(issue_rows) > 0 or "None" in section
 
     if has_concerns and not has_issues:
         result.errors.append("Agents raised CONCERN/QUESTION but Section 4 has no issues listed")
 
 
-def check_signoffs(content: str, result: ValidationResult) -> None:
+def check_signoffs(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 5: Sign-offs."""
-    section_match = re.search(
-        r"## Section 5: Sign-offs.*?(?=## Section 6:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(5)
+    if section is None:
         result.errors.append("Cannot parse Section 5: Sign-offs")
         return
 
-    section = section_match.group(0)
-
     # PM-Architect sign-off required
-    pm_match = re.search(
-        r"\|\s*PM-Architect-Agent\s*\|\s*(APPROVED|REJECTED|CONDITIONAL)\s*\|", section
-    )
+    pm_match = _PM_SIGNOFF_RE.search(section)
     if not pm_match:
         result.errors.append("PM-Architect-Agent sign-off missing or invalid")
 
     # Check other agents
     for agent in REQUIRED_AGENTS:
-        agent_pattern = rf"\|\s*{re.escape(agent)}\s*\|\s*(APPROVED|REJECTED|CONDITIONAL|N/A)\s*\|"
-        if not re.search(agent_pattern, section):
+        if not _AGENT_SIGNOFF_RES[agent].search(section):
             result.errors.append(f"'{agent}' sign-off missing or invalid")
 
 
-def check_gate_decision(content: str, result: ValidationResult) -> None:
+def check_gate_decision(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 6: Gate Decision with cross-validation."""
-    section_match = re.search(
-        r"## Section 6: Gate Decision.*?(?=## Section 7:|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(6)
+    if section is None:
         result.errors.append("Cannot parse Section 6: Gate Decision")
         return
-
-    section = section_match.group(0)
-    decision_match = re.search(r"\*\*Decision\*\*:\s*(\w+)", section)
+    decision_match = _DECISION_RE.search(section)
 
     if not decision_match:
         result.errors.append("Missing Gate Decision. Add: **Decision**: PASS, FAIL, or CONDITIONAL")
@@ -285,7 +507,7 @@ def check_gate_decision(content: str, result: ValidationResult) -> None:
     else:
         decision = decision_match.group(1)
         # Cross-validate: PASS should not have REJECTED PM sign-off
-        pm_rejected = re.search(r'\|\s*PM-Architect-Agent\s*\|\s*REJECTED\s*\|', content)
+        pm_rejected = _PM_REJECTED_RE.search(ctx.content)
         if decision == "PASS" and pm_rejected:
             result.errors.append("INCONSISTENCY: Decision is PASS but PM-Architect signed REJECTED")
         if decision == "FAIL" and "Blocking Issues" not in section:
@@ -294,28 +516,26 @@ def check_gate_decision(content: str, result: ValidationResult) -> None:
             result.warnings.append("Decision is CONDITIONAL but no Conditions documented")
 
 
-def check_validation_section(content: str, result: ValidationResult) -> None:
+def check_validation_section(ctx: GateContext, result: ValidationResult) -> None:
     """Check Section 7: Validation."""
-    section_match = re.search(
-        r"## Section 7: Validation.*?(?=## Document History|$)",
-        content, re.DOTALL
-    )
-    if not section_match:
+    section = ctx.sections.get(7)
+    if section is None:
         result.errors.append("Cannot parse Section 7: Validation")
         return
 
-    section = section_match.group(0)
-
-    if not re.search(r"\*\*Validation Result\*\*:\s*(VALID|INVALID)", section):
+    if not _VALIDATION_RESULT_RE.search(section):
         result.warnings.append("Validation Result not yet filled")
 
-    if not re.search(r"\*\*Validation Timestamp\*\*:\s*\d{4}-\d{2}-\d{2}T", section):
+    if not _VALIDATION_TS_PREFIX_RE.search(section):
         result.warnings.append("Validation Timestamp not yet filled")
 
 
-def check_unfilled_placeholders(content: str, result: ValidationResult) -> None:
+def check_unfilled_placeholders(ctx: GateContext, result: ValidationResult) -> None:
     """Check for unfilled template placeholders."""
-    placeholders = re.findall(r"\[REQUIRED[^\]]*\]", content)
+    # Common case: a filled-in record has no placeholder prefix at all
+    if "[REQUIRED" not in ctx.content:
+        return
+    placeholders = _PLACEHOLDER_RE.findall(ctx.content)
     if placeholders:
         result.errors.append(f"Found {len(placeholders)} unfilled [REQUIRED] placeholders")
         for p in list(set(placeholders))[:5]:
@@ -326,7 +546,7 @@ def check_unfilled_placeholders(content: str, result: ValidationResult) -> None:
 # P1-003: ANTI-FABRICATION CHECKS
 # =============================================================================
 
-def check_timestamp_consistency(content: str, file_path: str, result: ValidationResult) -> None:
+def check_timestamp_consistency(ctx: GateContext, result: ValidationResult) -> None:
     """
     P1-003: Check for timestamp fabrication indicators.
 
@@ -336,68 +556,67 @@ def check_timestamp_consistency(content: str, file_path: str, result: Validation
     3. Validation timestamp is not before invocation
     4. File modification time roughly matches document timestamps
     """
-    now = datetime.now()
+    now = ctx.now
+    gate_date = ctx.date
+    invoc_time = ctx.invocation_ts
+    valid_time = ctx.validation_ts
 
     # Check gate date
-    date_match = re.search(r"\*\*Date\*\*:\s*(\d{4}-\d{2}-\d{2})", content)
-    if date_match:
-        try:
-            gate_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-            if gate_date.date() > now.date():
-                result.errors.append(
-                    f"FABRICATION INDICATOR: Gate date {date_match.group(1)} is in the future"
-                )
-        except ValueError:
-            pass
+    if gate_date is not None and gate_date.date() > now.date():
+        result.errors.append(
+            f"FABRICATION INDICATOR: Gate date {ctx.date_text} is in the future"
+        )
 
     # Check invocation timestamp
-    invoc_match = re.search(
-        r"\*\*Invocation Timestamp\*\*:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})", content
-    )
-    if invoc_match:
-        try:
-            invoc_time = datetime.fromisoformat(invoc_match.group(1).replace("Z", ""))
-            if invoc_time > now:
-                result.errors.append(
-                    f"FABRICATION INDICATOR: Invocation timestamp is in the future"
-                )
-        except ValueError:
-            pass
+    if invoc_time is not None and invoc_time > now:
+        result.errors.append(
+            f"FABRICATION INDICATOR: Invocation timestamp is in the future"
+        )
 
     # Check validation timestamp
-    valid_match = re.search(
-        r"\*\*Validation Timestamp\*\*:\s*(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})", content
-    )
-    if valid_match and invoc_match:
-        try:
-            valid_time = datetime.fromisoformat(valid_match.group(1).replace("Z", ""))
-            invoc_time = datetime.fromisoformat(invoc_match.group(1).replace("Z", ""))
-            if valid_time < invoc_time:
-                result.errors.append(
-                    "FABRICATION INDICATOR: Validation timestamp is before invocation timestamp"
-                )
-        except ValueError:
-            pass
+    if valid_time is not None and invoc_time is not None and valid_time < invoc_time:
+        result.errors.append(
+            "FABRICATION INDICATOR: Validation timestamp is before invocation timestamp"
+        )
 
     # Check file modification time vs document date
-    path = Path(file_path)
+    if ctx.file_path is None:
+        return
+    path = Path(ctx.file_path)
     if path.exists():
         mtime = datetime.fromtimestamp(path.stat().st_mtime)
-        if date_match:
-            try:
-                gate_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                # If file was modified more than 7 days before the claimed date, suspicious
-                if mtime.date() < gate_date.date():
-                    days_diff = (gate_date.date() - mtime.date()).days
-                    if days_diff > 7:
-                        result.warnings.append(
-                            f"SUSPICIOUS: File mtime is {days_diff} days before claimed gate date"
-                        )
-            except ValueError:
-                pass
-
-
-def check_content_integrity(content: str, result: ValidationResult) -> None:
+        if gate_date is not None:
+            # If file was modified more than 7 days before the claimed date, suspicious
+            if mtime.date() < gate_date.date():
+                days_diff = (gate_date.date() - mtime.date()).days
+                if days_diff > 7:
+                    result.warnings.append(
+                        f"SUSPICIOUS: File mtime is {days_diff} days before claimed gate date"
+                    )
+
+
+def _count_unique_prefixes(pattern: "re.Pattern[str]", content: str, width: int) -> Tuple[int, int]:
+    """
+    Count pattern matches and distinct stripped group(1) prefixes of width chars.
+
+    Matches are streamed with finditer and only an int per distinct prefix
+    is kept. The builtin str hash is used deliberately: it is a single
+    machine word and much cheaper to compute than a digest such as
+    blake2b, and collision resistance does not matter for a heuristic
+    comparing entries within one document.
+
+    Returns:
+        (total matches, distinct prefixes)
+    """
+    total = 0
+    seen: Set[int] = set()
+    for match in pattern.finditer(content):
+        total += 1
+        seen.add(hash(match.group(1).strip()[:width]))
+    return total, len(seen)
+
+
+def check_content_integrity(ctx: GateContext, result: ValidationResult) -> None:
     """
     P1-003: Check for content fabrication indicators.
 
@@ -406,40 +625,38 @@ def check_content_integrity(content: str, result: ValidationResult) -> None:
     2. Checklist items have variety (not all identical)
     3. Signatures are from correct agents (not wrong names)
     """
+    content = ctx.content
+
     # Check for duplicate agent responses (sign of copy-paste fabrication)
-    summaries = re.findall(r"\*\*Summary\*\*.*?:\s*\n(.+?)(?=\*\*Checklist|\n\n|$)", content, re.DOTALL)
-    if summaries:
-        unique_summaries = set(s.strip()[:100] for s in summaries)  # First 100 chars
-        if len(unique_summaries) < len(summaries) / 2 and len(summaries) > 2:
-            result.warnings.append(
-                f"FABRICATION INDICATOR: Multiple agent responses appear identical ({len(summaries) - len(unique_summaries)} duplicates)"
-            )
+    summary_count, unique_summaries = _count_unique_prefixes(_SUMMARY_RE, content, 100)
+    if unique_summaries < summary_count / 2 and summary_count > 2:
+        result.warnings.append(
+            f"FABRICATION INDICATOR: Multiple agent responses appear identical ({summary_count - unique_summaries} duplicates)"
+        )
 
     # Check for suspicious patterns in checklist
-    checklist_items = re.findall(r"\|\s*\d+\s*\|([^|]+)\|", content)
-    if checklist_items:
-        unique_items = set(item.strip()[:50] for item in checklist_items)
-        if len(unique_items) < len(checklist_items) / 3 and len(checklist_items) > 5:
-            result.warnings.append(
-                "FABRICATION INDICATOR: Checklist items show low variety (possible copy-paste)"
-            )
+    item_count, unique_items = _count_unique_prefixes(_CHECKLIST_CELL_RE, content, 50)
+    if unique_items < item_count / 3 and item_count > 5:
+        result.warnings.append(
+            "FABRICATION INDICATOR: Checklist items show low variety (possible copy-paste)"
+        )
 
     # Check agent name consistency in sign-offs
-    signoff_agents = re.findall(r"\|\s*([^|]+Agent[^|]*)\s*\|\s*(?:APPROVED|REJECTED|CONDITIONAL|N/A)\s*\|", content)
-    for agent in signoff_agents:
-        agent_clean = agent.strip()
+    for match in _SIGNOFF_AGENT_RE.finditer(content):
+        agent_clean = match.group(1).strip()
         # Check for typos or fabricated agent names
-        known_agents = REQUIRED_AGENTS + ["PM-Architect-Agent"]
-        if agent_clean not in known_agents:
-            # Allow partial matches for formatting variations
-            found_match = any(known in agent_clean or agent_clean in known for known in known_agents)
-            if not found_match:
-                result.errors.append(
-                    f"FABRICATION INDICATOR: Unknown agent '{agent_clean}' in sign-off"
-                )
+        if agent_clean in _KNOWN_AGENTS:
+            continue
+        # Allow partial matches for formatting variations: a known name inside
+        # the cell, or the cell inside a known name ('|' never occurs in a cell)
+        if _KNOWN_AGENTS_RE.search(agent_clean) or agent_clean in _KNOWN_AGENTS_JOINED:
+            continue
+        result.errors.append(
+            f"FABRICATION INDICATOR: Unknown agent '{agent_clean}' in sign-off"
+        )
 
 
-def check_sequential_consistency(content: str, result: ValidationResult) -> None:
+def check_sequential_consistency(ctx: GateContext, result: ValidationResult) -> None:
     """
     P1-003: Check that gate follows logical sequence.
 
@@ -447,18 +664,14 @@ def check_sequential_consistency(content: str, result: ValidationResult) -> None
     1. Output gates should reference completed input gates
     2. Phase N output should come after Phase N input
     """
-    gate_type_match = re.search(r"\*\*Gate Type\*\*:\s*(Input|Output)", content)
-    phase_match = re.search(r"\*\*Phase\*\*:\s*(\d+)", content)
-    stage_match = re.search(r"\*\*Stage\*\*:\s*(\d+)", content)
-
-    if gate_type_match and phase_match and stage_match:
-        gate_type = gate_type_match.group(1)
-        phase = int(phase_match.group(1))
-        stage = int(stage_match.group(1))
+    gate_type = ctx.gate_type
+    phase = ctx.phase
+    stage = ctx.stage
 
+    if gate_type is not None and phase is not None and stage is not None:
         if gate_type == "Output":
             # Check if corresponding input gate is referenced or exists
-            input_ref = re.search(rf"phase{phase}-input-gate", content, re.IGNORECASE)
+            input_ref = re.search(rf"phase{phase}-input-gate", ctx.content, re.IGNORECASE)
             input_gate_path = Path(f".claude-bus/gates/stage{stage}/phase{phase}-input-gate.md")
 
             if not input_ref and not input_gate_path.exists():
@@ -471,7 +684,30 @@ def check_sequential_consistency(content: str, result: ValidationResult) -> None
 # P2-005: GIT CHECKPOINT VERIFICATION
 # =============================================================================
 
-def check_git_checkpoint(content: str, result: ValidationResult) -> None:
+def _find_commit_hash(content: str) -> Optional[str]:
+    """Return the highest-priority commit hash reference in content, if any."""
+    lowered = content.lower()
+    if len(lowered) == len(content):
+        matches = _COMMIT_RE.finditer(lowered)
+    else:
+        matches = _COMMIT_ICASE_RE.finditer(content)
+
+    found: Dict[str, str] = {}
+    for match in matches:
+        group = match.lastgroup
+        if group is not None and group not in found:
+            # Slice the original text: the hash keeps its case for the
+            # format check that follows
+            found[group] = content[match.start(group):match.end(group)]
+            if group == "gc":
+                break
+    for group in _COMMIT_GROUPS:
+        if group in found:
+            return found[group]
+    return None
+
+
+def check_git_checkpoint(ctx: GateContext, result: ValidationResult) -> None:
     """
     P2-005: Verify git checkpoint is referenced in Phase 2+ Output gates.
 
@@ -479,36 +715,18 @@ def check_git_checkpoint(content: str, result: ValidationResult) -> None:
     1. Phase 2 Output gates should reference a git commit hash
     2. The commit hash should be valid format (7-40 hex chars)
     """
-    import subprocess
+    gate_type = ctx.gate_type
+    phase = ctx.phase
 
-    gate_type_match = re.search(r"\*\*Gate Type\*\*:\s*(Input|Output)", content)
-    phase_match = re.search(r"\*\*Phase\*\*:\s*(\d+)", content)
-
-    if not gate_type_match or not phase_match:
+    if gate_type is None or phase is None:
         return
 
-    gate_type = gate_type_match.group(1)
-    phase = int(phase_match.group(1))
-
     # Only check Phase 2+ Output gates
     if gate_type != "Output" or phase < 2:
         return
 
     # Look for git commit hash reference
-    # Common patterns: "Commit:", "Git Checkpoint:", "Hash:", or raw commit hashes
-    commit_patterns = [
-        r"\*\*Git Checkpoint\*\*:\s*([a-f0-9]{7,40})",
-        r"\*\*Commit\*\*:\s*([a-f0-9]{7,40})",
-        r"commit[:\s]+([a-f0-9]{7,40})",
-        r"\b([a-f0-9]{7,40})\s+Stage",  # "abc1234 Stage 5 Phase 2 Complete"
-    ]
-
-    commit_hash = None
-    for pattern in commit_patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            commit_hash = match.group(1)
-            break
+    commit_hash = _find_commit_hash(ctx.content)
 
     if not commit_hash:
         result.warnings.append(
@@ -517,7 +735,7 @@ def check_git_checkpoint(content: str, result: ValidationResult) -> None:
         return
 
     # Validate the commit hash format
-    if not re.match(r"^[a-f0-9]{7,40}$", commit_hash):
+    if not _COMMIT_HASH_RE.match(commit_hash):
         result.warnings.append(
             f"P2-005: Invalid commit hash format: {commit_hash}"
         )
@@ -525,13 +743,7 @@ def check_git_checkpoint(content: str, result: ValidationResult) -> None:
 
     # Optionally verify commit exists (may fail in CI without full git history)
     try:
-        proc = subprocess.run(
-            ["git", "cat-file", "-t", commit_hash],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if proc.returncode != 0:
+        if not object_exists(commit_hash):
             result.warnings.append(
                 f"P2-005: Commit hash {commit_hash[:7]} not found in git history"
             )
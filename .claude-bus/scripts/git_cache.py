@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Git Command Cache - Memoized git Subprocess Calls
+
+Gate scripts are short-lived single-command processes, so the repository
+does not change underneath them while they run. Each distinct git
+invocation is therefore executed once per process and its result reused
+by later checks, and object lookups share one `git cat-file --batch-check`
+child instead of spawning git per hash.
+
+Optional dependency: pygit2 (libgit2 bindings). When installed, recent
+commit subjects are read in-process without spawning git at all.
+
+Author: PM-Architect-Agent
+Created: 2025-12-14
+"""
+
+import atexit
+import os
+import subprocess
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    import pygit2
+except ImportError:  # Optional dependency
+    pygit2 = None
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+GIT_CACHE_SIZE = 128
+OBJECT_LOOKUP_TIMEOUT = 5  # seconds per cat-file answer
+
+
+@lru_cache(maxsize=GIT_CACHE_SIZE)
+def git(
+    *args: str,
+    cwd: Optional[Union[str, Path]] = None,
+    timeout: Optional[float] = None
+) -> Tuple[int, str]:
+    """
+    Run `git <args>` once per process and memoize the result.
+
+    Args:
+        *args: git arguments, e.g. ("log", "--oneline", "-20")
+        cwd: Working directory for git (current directory when omitted)
+        timeout: Seconds before subprocess.TimeoutExpired is raised
+
+    Returns:
+        (returncode, stdout) tuple
+
+    Raises:
+        OSError: git is not installed (not cached, so the next call retries)
+        subprocess.TimeoutExpired: git did not finish in time (not cached)
+    """
+    proc = subprocess.run(
+        ["git", *args],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, cwd=cwd,
+        timeout=timeout
+    )
+    return proc.returncode, proc.stdout
+
+
+# =============================================================================
+# COMMIT HISTORY
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _repository(cwd: Optional[str]) -> Any:
+    """Open the repository containing cwd with pygit2 (None if not a repo)."""
+    path = pygit2.discover_repository(cwd or ".")
+    return pygit2.Repository(path) if path else None
+
+
+def recent_commits_mention(
+    needles: Sequence[str],
+    count: int,
+    cwd: Optional[Union[str, Path]] = None
+) -> bool:
+    """
+    Whether any of the last count commit subjects contains one of needles.
+
+    Matching is case-insensitive. Uses pygit2 in-process when available and
+    falls back to the memoized `git log --format=%s`. False means no match,
+    no history, or not a repository.
+    """
+    lowered = [n.lower() for n in needles]
+    if pygit2 is not None:
+        try:
+            repo = _repository(None if cwd is None else str(cwd))
+            if repo is None or repo.head_is_unborn:
+                return False
+            # Newest commit date first, git log's default order
+            walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+            for _, commit in zip(range(count), walker):
+                subject = commit.message.split("\n", 1)[0].lower()
+                if any(n in subject for n in lowered):
+                    return True
+            return False
+        except (pygit2.GitError, KeyError, ValueError):
+            pass
+
+    # Subjects only, filtered here: `git log --grep` would search whole
+    # messages, and HEAD~count..HEAD pulls in every commit of a merged branch
+    returncode, stdout = git("log", "--format=%s", f"-{count}", cwd=cwd)
+    if returncode != 0:
+        return False
+    return any(n in subject for subject in stdout.lower().splitlines() for n in lowered)
+
+
+# =============================================================================
+# OBJECT LOOKUP (git cat-file --batch-check)
+# =============================================================================
+
+class _CatFileBatch:
+    """A long-lived `git cat-file --batch-check` process fed over stdin."""
+
+    def __init__(self, cwd: Optional[Union[str, Path]] = None):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, cwd=cwd
+        )
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.known: Dict[str, bool] = {}
+        self.timed_out = False
+
+    def _kill(self) -> None:
+        """Timer callback: stop a git process that stopped answering."""
+        self.timed_out = True
+        self.proc.kill()
+
+    def exists(self, rev: str, timeout: float = OBJECT_LOOKUP_TIMEOUT) -> bool:
+        """
+        Check whether rev names an object in the repository.
+
+        Missing, ambiguous and malformed names are reported as not found,
+        as is a git process that exited early (e.g. not a repository).
+
+        Raises:
+            subprocess.TimeoutExpired: git did not answer within timeout
+                (the process is killed; object_exists starts a new one)
+        """
+        with self.lock:
+            if rev in self.known:
+                return self.known[rev]
+            # readline() cannot time out, so kill git to unblock it
+            timer = threading.Timer(timeout, self._kill)
+            timer.start()
+            try:
+                self.proc.stdin.write(f"{rev}\n")
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+            except (BrokenPipeError, ValueError):
+                line = ""
+            finally:
+                timer.cancel()
+            if self.timed_out and not line:
+                raise subprocess.TimeoutExpired(self.proc.args, timeout)
+            # Found: "<sha> <type> <size>"; otherwise "<rev> missing" etc.
+            parts = line.split()
+            found = len(parts) == 3 and parts[2].isdigit()
+            self.known[rev] = found
+            return found
+
+    def close(self) -> None:
+        """Close stdin and reap the git process (only in the process that started it)."""
+        if os.getpid() != self.pid:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
+_cat_file: Optional[_CatFileBatch] = None
+_cat_file_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """
+    Drop the parent's cat-file process in a forked child.
+
+    Its pipes are shared with the parent, so a child (e.g. a validate_many
+    worker) reading them would steal answers meant for other processes.
+    """
+    global _cat_file, _cat_file_lock
+    _cat_file = None
+    _cat_file_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def object_exists(rev: str) -> bool:
+    """
+    Check whether rev (e.g. a commit hash) exists in the current repository.
+
+    The first call starts `git cat-file --batch-check`; later calls reuse it
+    (a forked child or a timed-out lookup starts a new one). Equivalent to
+    `git cat-file -t <rev>` exiting 0.
+
+    Raises:
+        OSError: git is not installed
+        subprocess.TimeoutExpired: git did not answer within
+            OBJECT_LOOKUP_TIMEOUT seconds
+    """
+    global _cat_file
+    with _cat_file_lock:
+        if _cat_file is None or _cat_file.timed_out:
+            _cat_file = _CatFileBatch()
+            atexit.register(_cat_file.close)
+        batch = _cat_file
+    return batch.exists(rev)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+JSON Compatibility Layer - Optional orjson Acceleration
+
+Uses orjson for encode/decode when installed and falls back to the
+stdlib json module otherwise. Callers keep catching json.JSONDecodeError
+(orjson.JSONDecodeError subclasses it).
+
+Author: PM-Architect-Agent
+Created: 2025-12-14
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Encode obj as a JSON string.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with 2-space indentation (CLI --json output)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Markdown Buffer - Shared Line/Section Writer
+
+The handoff and session-context generators build their markdown in one
+io.StringIO. MarkdownBuffer adds the two helpers both use, line() and
+section(), so the chrome around each section is written the same way.
+
+Author: PM-Architect-Agent
+Created: 2025-12-14
+"""
+
+import io
+
+
+class MarkdownBuffer(io.StringIO):
+    """
+    io.StringIO with markdown line and section helpers.
+
+    Usage:
+        buf = MarkdownBuffer()
+        buf.section("## Current State")
+        buf.line("- **Stage**: 1")
+        text = buf.getvalue()
+    """
+
+    def line(self, text: str = "") -> None:
+        """Write text followed by a newline."""
+        self.write(text)
+        self.write("\n")
+
+    def section(self, title: str) -> None:
+        """Write a horizontal rule and a section heading, each followed by a blank line."""
+        self.write(f"---\n\n{title}\n\n")
@@ -23,11 +23,18 @@ Based on Agent recommendations (2025-12-14):
 """
 
 import json
+import mmap
+import os
 import re
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import sys
+from dataclasses import dataclass
+
+from gate_config import MMAP_THRESHOLD
+from md_buffer import MarkdownBuffer
 
 
 # =============================================================================
@@ -38,16 +45,76 @@ GATES_DIR = Path(".claude-bus/gates")
 PM_STATE_FILE = Path(".claude-bus/pm-state.json")
 HANDOFFS_DIR = Path(".claude-bus/handoffs")
 OUTPUT_FILE = Path(".claude-bus/SESSION_CONTEXT.md")
+MANIFEST_FILE = GATES_DIR / ".manifest.json"
+
+# Gate is PASSED if any of these appear - supports PASS, PASSED,
+# PASS (with tech debt) and the Section 6 Decision line. The literal
+# markers are searched in the raw bytes; the regex needs decoded text
+_PASS_MARKERS = (b"Status**: PASS", b"**Decision**: PASS")
+_PASS_RE = re.compile(r"\*\*Status\*\*:\s*PASS", re.IGNORECASE)
+_STAGE_RE = re.compile(r"stage(\d+)")
+_PHASE_RE = re.compile(r"phase(\d+)-(input|output)")
+_GATE_GLOB = "phase*-*-gate*.md"
+
+# datetime.fromisoformat() accepts a trailing "Z" from Python 3.11
+_FROMISOFORMAT_Z = sys.version_info >= (3, 11)
 
 
 # =============================================================================
 # GATE RECORD SCANNING
 # =============================================================================
 
+def _load_manifest() -> Dict[str, Dict[str, Any]]:
+    """Load the gate scan manifest ({} if missing or unreadable)."""
+    try:
+        manifest = json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(manifest: Dict[str, Dict[str, Any]]) -> None:
+    """Write the gate scan manifest atomically; failures are ignored (cache only)."""
+    temp_file = MANIFEST_FILE.with_name(f"{MANIFEST_FILE.name}.{os.getpid()}.tmp")
+    try:
+        temp_file.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_file, MANIFEST_FILE)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
+def _gate_passed(gate_file: str, size: int) -> bool:
+    """
+    Check whether a gate record is marked PASSED.
+
+    Records of MMAP_THRESHOLD bytes or more are memory-mapped rather than
+    read. Only records without a literal marker are decoded for the
+    case-insensitive regex.
+    """
+    with open(gate_file, "rb") as f:
+        if size < MMAP_THRESHOLD:
+            return _content_passed(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _content_passed(mm)
+
+
+def _content_passed(data: Union[bytes, mmap.mmap]) -> bool:
+    """Search raw gate record bytes (or an mmap) for a PASS marker."""
+    if any(data.find(marker) != -1 for marker in _PASS_MARKERS):
+        return True
+    return _PASS_RE.search(bytes(data).decode("utf-8")) is not None
+
+
 def scan_gate_records() -> Dict[str, Any]:
     """
     Scan gate records to determine authoritative state.
 
+    PASS status is cached in MANIFEST_FILE keyed by (mtime_ns, size), so
+    only new or modified gate records are re-read.
+
     Returns:
         Dictionary with gate scan results
     """
@@ -63,33 +130,50 @@ def scan_gate_records() -> Dict[str, Any]:
         state["scan_errors"].append(f"Gates directory not found: {GATES_DIR}")
         return state
 
-    for stage_dir in sorted(GATES_DIR.glob("stage*")):
-        if not stage_dir.is_dir():
+    try:
+        with os.scandir(GATES_DIR) as stage_entries:
+            stage_dirs = sorted(
+                (e.name, e.path) for e in stage_entries
+                if e.name.startswith("stage") and e.is_dir()
+            )
+    except OSError:
+        return state
+
+    manifest = _load_manifest()
+    scanned = {}
+
+    for stage_name, stage_path in stage_dirs:
+        match = _STAGE_RE.fullmatch(stage_name)
+        if not match:
+            state["scan_errors"].append(f"Invalid stage directory: {stage_name}")
             continue
+        stage_num = int(match.group(1))
 
         try:
-            stage_num = int(stage_dir.name.replace("stage", ""))
-        except ValueError:
-            state["scan_errors"].append(f"Invalid stage directory: {stage_dir.name}")
+            with os.scandir(stage_path) as gate_entries:
+                gates = sorted(
+                    (e.name, e) for e in gate_entries if fnmatchcase(e.name, _GATE_GLOB)
+                )
+        except OSError:
             continue
 
-        for gate_file in sorted(stage_dir.glob("phase*-*-gate*.md")):
+        for name, entry in gates:
+            key = entry.path
             try:
-                content = gate_file.read_text(encoding="utf-8")
+                st = entry.stat()
+                cached = manifest.get(key)
+                if (isinstance(cached, dict) and cached.get("mtime_ns") == st.st_mtime_ns
+                        and cached.get("size") == st.st_size):
+                    is_passed = bool(cached.get("passed"))
+                else:
+                    is_passed = _gate_passed(key, st.st_size)
             except Exception as e:
-                state["scan_errors"].append(f"Cannot read {gate_file}: {e}")
+                state["scan_errors"].append(f"Cannot read {key}: {e}")
                 continue
-
-            # Check if PASSED - Support variations: PASS, PASSED, PASS (with tech debt)
-            is_passed = (
-                "**Status**: PASS" in content or
-                "Status**: PASS" in content or
-                "**Decision**: PASS" in content or  # Section 6 Decision
-                bool(re.search(r"\*\*Status\*\*:\s*PASS(?:ED)?(?:\s*\([^)]+\))?", content, re.IGNORECASE))
-            )
+            scanned[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "passed": is_passed}
 
             # Extract phase and gate type from filename
-            match = re.search(r"phase(\d+)-(input|output)", gate_file.name)
+            match = _PHASE_RE.search(name)
             if match:
                 phase_num = int(match.group(1))
                 gate_type = match.group(2)
@@ -98,7 +182,7 @@ def scan_gate_records() -> Dict[str, Any]:
                     "stage": stage_num,
                     "phase": phase_num,
                     "type": gate_type,
-                    "file": str(gate_file),
+                    "file": key,
                     "passed": is_passed
                 }
                 state["gates_found"].append(gate_info)
@@ -119,6 +203,9 @@ def scan_gate_records() -> Dict[str, Any]:
                                 if state["last_passed_gate"]["type"] == "input":
                                     state["last_passed_gate"] = gate_info
 
+    if scanned != manifest:
+        _save_manifest(scanned)
+
     return state
 
 
@@ -138,16 +225,20 @@ def read_pm_state() -> Optional[Dict[str, Any]]:
         return {"error": f"Cannot read PM state: {e}"}
 
 
-def update_pm_state(updates: Dict[str, Any]) -> bool:
+def update_pm_state(updates: Dict[str, Any], durable: bool = False) -> bool:
     """
     Update PM state file with new values.
 
     Args:
         updates: Dictionary of fields to update
+        durable: fsync the new file and its directory so the update
+            survives a crash (slower; off by default)
 
     Returns:
         True if successful
     """
+    # Per-process temp name so concurrent writers don't clobber each other
+    temp_file = PM_STATE_FILE.with_suffix(f".tmp.{os.getpid()}")
     try:
         if PM_STATE_FILE.exists():
             current = json.loads(PM_STATE_FILE.read_text(encoding="utf-8"))
@@ -158,35 +249,75 @@ def update_pm_state(updates: Dict[str, Any]) -> bool:
         current.update(updates)
         current["updated_at"] = datetime.utcnow().isoformat() + "Z"
 
-        # Write atomically (write to temp, then rename)
-        temp_file = PM_STATE_FILE.with_suffix(".tmp")
-        temp_file.write_text(json.dumps(current, indent=2), encoding="utf-8")
-        temp_file.rename(PM_STATE_FILE)
+        # Write atomically (write to temp, then replace); indented because
+        # the file is also edited by hand
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file, PM_STATE_FILE)
+        if durable:
+            _fsync_dir(PM_STATE_FILE.parent)
 
         return True
     except Exception as e:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
         print(f"Error updating PM state: {e}", file=sys.stderr)
         return False
 
 
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry to disk (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 # =============================================================================
 # HANDOFF FILES
 # =============================================================================
 
-def read_latest_handoff() -> Optional[str]:
-    """Read most recent handoff file."""
-    if not HANDOFFS_DIR.exists():
+def _latest_handoff_path() -> Optional[str]:
+    """Path of the newest session-*.md handoff (names sort by date/number)."""
+    latest_name = latest_path = None
+    try:
+        with os.scandir(HANDOFFS_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("session-") and name.endswith(".md"):
+                    if latest_name is None or name > latest_name:
+                        latest_name, latest_path = name, entry.path
+    except (FileNotFoundError, NotADirectoryError):
         return None
+    return latest_path
 
-    handoffs = sorted(HANDOFFS_DIR.glob("session-*.md"), reverse=True)
-    if handoffs:
+
+def _read_handoff(path: Optional[str]) -> Optional[str]:
+    """Read a handoff file (None when path is None or unreadable)."""
+    if path:
         try:
-            return handoffs[0].read_text(encoding="utf-8")
+            return Path(path).read_text(encoding="utf-8")
         except Exception:
             return None
     return None
 
 
+def read_latest_handoff() -> Optional[str]:
+    """Read most recent handoff file."""
+    return _read_handoff(_latest_handoff_path())
+
+
 # =============================================================================
 # CROSS-VALIDATION
 # =============================================================================
@@ -237,7 +368,10 @@ def cross_validate(gate_state: Dict, pm_state: Optional[Dict]) -> List[str]:
     # Check for stale PM state
     if pm_state.get("updated_at"):
         try:
-            updated = datetime.fromisoformat(pm_state["updated_at"].replace("Z", "+00:00"))
+            updated_at = pm_state["updated_at"]
+            if not _FROMISOFORMAT_Z:
+                updated_at = updated_at.replace("Z", "+00:00")
+            updated = datetime.fromisoformat(updated_at)
             age_hours = (datetime.now(updated.tzinfo) - updated).total_seconds() / 3600
             if age_hours > 24:
                 warnings.append(
@@ -293,139 +427,142 @@ def determine_next_steps(gate_state: Dict, pm_state: Optional[Dict], warnings: L
     return steps
 
 
-def generate_context() -> str:
-    """Generate SESSION_CONTEXT.md content."""
+@dataclass(frozen=True)
+class SessionState:
+    """Gate, PM and handoff state shared by both output formats (read-only)."""
+    gate_state: Dict[str, Any]
+    pm_state: Optional[Dict[str, Any]]
+    handoff_path: Optional[str]
+    warnings: List[str]
+    next_steps: List[str]
+
+
+def collect_state() -> SessionState:
+    """
+    Scan gate records, PM state and handoffs.
+
+    Not cached: each call reads the files fresh. A caller producing both
+    formats can collect once and pass the result to generate_context and
+    generate_json_context.
+    """
     gate_state = scan_gate_records()
     pm_state = read_pm_state()
-    handoff = read_latest_handoff()
     warnings = cross_validate(gate_state, pm_state)
-    next_steps = determine_next_steps(gate_state, pm_state, warnings)
-
-    lines = [
-        "# Session Context (Auto-Generated)",
-        "",
-        f"**Generated**: {datetime.utcnow().isoformat()}Z",
-        f"**Script**: session_resume.py",
-        "",
-        "---",
-        "",
-        "## 1. Authoritative State (from Gate Records)",
-        "",
-    ]
+    return SessionState(
+        gate_state=gate_state,
+        pm_state=pm_state,
+        handoff_path=_latest_handoff_path(),
+        warnings=warnings,
+        next_steps=determine_next_steps(gate_state, pm_state, warnings),
+    )
+
+
+def generate_context(state: Optional[SessionState] = None) -> str:
+    """
+    Generate SESSION_CONTEXT.md content.
+
+    Args:
+        state: Previously collected state; scanned fresh when omitted
+    """
+    state = state or collect_state()
+    gate_state, pm_state = state.gate_state, state.pm_state
+    warnings, next_steps = state.warnings, state.next_steps
+    handoff = _read_handoff(state.handoff_path)
+
+    buf = MarkdownBuffer()
+    write, line, section = buf.write, buf.line, buf.section
+
+    line("# Session Context (Auto-Generated)")
+    line()
+    line(f"**Generated**: {datetime.utcnow().isoformat()}Z")
+    line("**Script**: session_resume.py")
+    line()
+    section("## 1. Authoritative State (from Gate Records)")
 
     if gate_state.get("last_passed_gate"):
         last = gate_state["last_passed_gate"]
-        lines.extend([
-            f"- **Last Passed Gate**: Stage {last['stage']} Phase {last['phase']} {last['type'].upper()}",
-            f"- **Gate File**: `{last['file']}`",
-            f"- **Total Gates Found**: {len(gate_state.get('gates_found', []))}",
-            "",
-        ])
+        line(f"- **Last Passed Gate**: Stage {last['stage']} Phase {last['phase']} {last['type'].upper()}")
+        line(f"- **Gate File**: `{last['file']}`")
+        line(f"- **Total Gates Found**: {len(gate_state.get('gates_found', []))}")
+        line()
     else:
-        lines.extend([
-            "- **No passed gates found**",
-            "- Project appears to be at initial state",
-            "",
-        ])
+        line("- **No passed gates found**")
+        line("- Project appears to be at initial state")
+        line()
 
     if gate_state.get("scan_errors"):
-        lines.extend([
-            "### Gate Scan Errors",
-            "",
-            *[f"- {e}" for e in gate_state["scan_errors"]],
-            "",
-        ])
-
-    lines.extend([
-        "---",
-        "",
-        "## 2. Operational Context (from PM State)",
-        "",
-    ])
+        line("### Gate Scan Errors")
+        line()
+        buf.writelines(f"- {e}\n" for e in gate_state["scan_errors"])
+        line()
+
+    section("## 2. Operational Context (from PM State)")
 
     if pm_state and "error" not in pm_state:
-        lines.extend([
-            f"- **Current Stage**: {pm_state.get('current_stage', 'Unknown')}",
-            f"- **Current Phase**: {pm_state.get('current_phase', 'Unknown')}",
-            f"- **Phase Status**: {pm_state.get('phase_status', 'Unknown')}",
-            f"- **Last Updated**: {pm_state.get('updated_at', 'Unknown')}",
-            "",
-        ])
+        line(f"- **Current Stage**: {pm_state.get('current_stage', 'Unknown')}")
+        line(f"- **Current Phase**: {pm_state.get('current_phase', 'Unknown')}")
+        line(f"- **Phase Status**: {pm_state.get('phase_status', 'Unknown')}")
+        line(f"- **Last Updated**: {pm_state.get('updated_at', 'Unknown')}")
+        line()
 
         if pm_state.get("pending_actions"):
-            lines.extend([
-                "### Pending Actions",
-                "",
-                *[f"- [{a.get('priority', 'medium').upper()}] {a.get('description', a)}"
-                  for a in pm_state["pending_actions"]],
-                "",
-            ])
+            line("### Pending Actions")
+            line()
+            buf.writelines(
+                f"- [{a.get('priority', 'medium').upper()}] {a.get('description', a)}\n"
+                for a in pm_state["pending_actions"]
+            )
+            line()
 
         if pm_state.get("active_blockers"):
-            lines.extend([
-                "### Active Blockers",
-                "",
-                *[f"- [{b.get('severity', 'unknown').upper()}] {b.get('description', b)}"
-                  for b in pm_state["active_blockers"]],
-                "",
-            ])
+            line("### Active Blockers")
+            line()
+            buf.writelines(
+                f"- [{b.get('severity', 'unknown').upper()}] {b.get('description', b)}\n"
+                for b in pm_state["active_blockers"]
+            )
+            line()
 
         if pm_state.get("notes"):
-            lines.extend([
-                "### Notes",
-                "",
-                pm_state["notes"],
-                "",
-            ])
+            line("### Notes")
+            line()
+            line(pm_state["notes"])
+            line()
     else:
-        lines.extend([
-            "- PM state file not found or invalid",
-            "- Relying on gate records for state",
-            "",
-        ])
+        line("- PM state file not found or invalid")
+        line("- Relying on gate records for state")
+        line()
 
     if warnings:
-        lines.extend([
-            "---",
-            "",
-            "## Warnings",
-            "",
-            *[f"- {w}" for w in warnings],
-            "",
-        ])
+        section("## Warnings")
+        buf.writelines(f"- {w}\n" for w in warnings)
+        line()
 
     if handoff:
-        lines.extend([
-            "---",
-            "",
-            "## 3. Previous Session Notes",
-            "",
-            handoff[:2000] if len(handoff) > 2000 else handoff,
-            "",
-        ])
-
-    lines.extend([
-        "---",
-        "",
-        "## Recommended Next Steps",
-        "",
-        *[f"{i+1}. {step}" for i, step in enumerate(next_steps)],
-        "",
-        "---",
-        "",
-        "*This file is auto-generated. Do not edit manually.*",
-        "*Run `python .claude-bus/scripts/session_resume.py` to regenerate.*",
-    ])
-
-    return "\n".join(lines)
-
-
-def generate_json_context() -> Dict[str, Any]:
-    """Generate session context as JSON."""
-    gate_state = scan_gate_records()
-    pm_state = read_pm_state()
-    warnings = cross_validate(gate_state, pm_state)
-    next_steps = determine_next_steps(gate_state, pm_state, warnings)
+        section("## 3. Previous Session Notes")
+        line(handoff[:2000])
+        line()
+
+    section("## Recommended Next Steps")
+    buf.writelines(f"{i+1}. {step}\n" for i, step in enumerate(next_steps))
+    line()
+    line("---")
+    line()
+    line("*This file is auto-generated. Do not edit manually.*")
+    write("*Run `python .claude-bus/scripts/session_resume.py` to regenerate.*")
+
+    return buf.getvalue()
+
+
+def generate_json_context(state: Optional[SessionState] = None) -> Dict[str, Any]:
+    """
+    Generate session context as JSON.
+
+    Args:
+        state: Previously collected state; scanned fresh when omitted
+    """
+    state = state or collect_state()
+    gate_state, pm_state = state.gate_state, state.pm_state
 
     return {
         "generated_at": datetime.utcnow().isoformat() + "Z",
@@ -437,12 +574,29 @@ def generate_json_context() -> Dict[str, Any]:
             "scan_errors": gate_state.get("scan_errors", [])
         },
         "pm_state": pm_state if pm_state and "error" not in pm_state else None,
-        "warnings": warnings,
-        "next_steps": next_steps,
-        "has_handoff": HANDOFFS_DIR.exists() and any(HANDOFFS_DIR.glob("session-*.md"))
+        "warnings": state.warnings,
+        "next_steps": state.next_steps,
+        "has_handoff": state.handoff_path is not None
     }
 
 
+def _write_output(path: Path, text: str) -> None:
+    """
+    Write text to path as UTF-8, truncating any previous content.
+
+    Uses os.open/os.write directly instead of Path.write_text, which
+    builds a TextIOWrapper over a buffered file for one write. Not
+    fsync'd: the file is regenerated on every run.
+    """
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)  # umask applies, as with write_text
+    try:
+        while data:
+            data = data[os.write(fd, data):]  # os.write may write partially
+    finally:
+        os.close(fd)
+
+
 # =============================================================================
 # ENTRY POINT
 # =============================================================================
@@ -473,7 +627,7 @@ def main():
 
         # Write to file
         try:
-            OUTPUT_FILE.write_text(context, encoding="utf-8")
+            _write_output(OUTPUT_FILE, context)
             print(context)
             print()
             print(f"Context written to: {OUTPUT_FILE}")
@@ -8,11 +8,14 @@ all mandatory information from actual agent invocations.
 Usage:
     python validate_gate.py <gate-record-file.md>
     python validate_gate.py <gate-record-file.md> --json
+    python validate_gate.py <gate-1.md> <gate-2.md> ...   # validated in parallel
+    python validate_gate.py <gate-1.md> <gate-2.md> ... --json   # one JSON array
 
 Exit codes:
     0 = VALID (gate record passes all checks)
     1 = INVALID (gate record has errors)
     2 = WARNINGS (gate record has warnings but no errors)
+    With several files, the worst result across them determines the code.
 
 Refactored: 2025-12-14 (TD-S5-003: Split from 702 lines to modular design)
 - gate_config.py: Configuration constants and data classes
@@ -23,10 +26,15 @@ Refactored: 2025-12-14 (TD-S5-003: Split from 702 lines to modular design)
 Author: PM-Architect-Agent
 """
 
+import os
 import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
 
 from gate_config import ValidationResult
 from gate_validators import (
+    GateContext,
     read_file,
     check_required_sections,
     check_metadata,
@@ -45,19 +53,52 @@ from gate_validators import (
     # P2-005: Git checkpoint verification
     check_git_checkpoint,
 )
-from gate_output import print_result, print_json_result
+from gate_output import print_result, print_json_result, print_json_results
 
 
-def validate_gate(file_path: str) -> ValidationResult:
+# Results memoised per (path, file identity, mtime, size); a rewritten file
+# gets a fresh key. Checks that also depend on the clock, git history or a
+# sibling input gate are not re-run for an unchanged record in one process.
+VALIDATION_CACHE_SIZE = 512
+
+
+def validate_gate(file_path: Union[str, Path]) -> ValidationResult:
     """
     Main validation function.
 
+    Unchanged files are served from an in-process LRU cache keyed on their
+    stat signature; each call still returns an independent result object.
+
     Args:
         file_path: Path to the gate record file
 
     Returns:
         ValidationResult with errors, warnings, and info
     """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        # Missing/unreadable: let the uncached path report the error
+        return _validate_uncached(file_path)
+
+    signature = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _validate_cached(os.fspath(file_path), signature)
+    return ValidationResult(
+        valid=cached.valid,
+        errors=list(cached.errors),
+        warnings=list(cached.warnings),
+        info=list(cached.info),
+    )
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_cached(file_path: str, signature: Tuple[int, int, int, int]) -> ValidationResult:
+    """Memoised _validate_uncached; signature only participates in the key."""
+    return _validate_uncached(file_path)
+
+
+def _validate_uncached(file_path: Union[str, Path]) -> ValidationResult:
+    """Run every gate check against file_path."""
     result = ValidationResult(valid=True)
 
     try:
@@ -80,24 +121,25 @@ def validate_gate(file_path: str) -> ValidationResult:
         return result
 
     # Run all validation checks
-    check_required_sections(content, result)
-    check_metadata(content, result)
-    check_agent_invocation(content, result)
-    check_agent_responses(content, result)
-    check_consolidated_checklist(content, result)
-    check_unresolved_issues(content, result)
-    check_signoffs(content, result)
-    check_gate_decision(content, result)
-    check_validation_section(content, result)
-    check_unfilled_placeholders(content, result)
+    ctx = GateContext(content, file_path)
+    check_required_sections(ctx, result)
+    check_metadata(ctx, result)
+    check_agent_invocation(ctx, result)
+    check_agent_responses(ctx, result)
+    check_consolidated_checklist(ctx, result)
+    check_unresolved_issues(ctx, result)
+    check_signoffs(ctx, result)
+    check_gate_decision(ctx, result)
+    check_validation_section(ctx, result)
+    check_unfilled_placeholders(ctx, result)
 
     # P1-003: Anti-fabrication checks
-    check_timestamp_consistency(content, file_path, result)
-    check_content_integrity(content, result)
-    check_sequential_consistency(content, result)
+    check_timestamp_consistency(ctx, result)
+    check_content_integrity(ctx, result)
+    check_sequential_consistency(ctx, result)
 
     # P2-005: Git checkpoint verification
-    check_git_checkpoint(content, result)
+    check_git_checkpoint(ctx, result)
 
     # Determine overall validity
     result.valid = len(result.errors) == 0
@@ -105,34 +147,68 @@ def validate_gate(file_path: str) -> ValidationResult:
     return result
 
 
+def validate_many(
+    paths: Sequence[Union[str, Path]], workers: Optional[int] = None
+) -> List[ValidationResult]:
+    """
+    Validate several gate records, in parallel worker processes.
+
+    Each record is independent and validation is CPU-bound regex work, so
+    a process pool sidesteps the GIL. A single path (or workers=1) runs in
+    this process to avoid pool start-up cost.
+
+    Args:
+        paths: Gate record files to validate
+        workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        ValidationResult per path, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(paths) <= 1 or workers == 1:
+        return [validate_gate(p) for p in paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers, len(paths))
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_gate, paths, chunksize=chunksize))
+
+
 def main():
     """Main entry point."""
     args = sys.argv[1:]
 
     if not args or args[0] in ["-h", "--help"]:
-        print("Usage: python validate_gate.py <gate-record-file.md> [--json]")
+        print("Usage: python validate_gate.py <gate-record-file.md> [more-files.md ...] [--json]")
         print()
         print("Options:")
-        print("  --json    Output in JSON format (for CI/CD integration)")
+        print("  --json    Output in JSON format (for CI/CD integration);")
+        print("            several files print one JSON array")
         print()
         print("Example:")
         print("  python validate_gate.py .claude-bus/gates/stage5/phase2-output-gate.md")
         sys.exit(0 if args and args[0] in ["-h", "--help"] else 1)
 
-    file_path = args[0]
+    file_paths = [a for a in args if not a.startswith("--")]
     json_output = "--json" in args
+    if not file_paths:
+        print("Error: no gate record file given")
+        sys.exit(1)
 
-    result = validate_gate(file_path)
+    results = validate_many(file_paths)
 
     if json_output:
-        print_json_result(result, file_path)
+        print_json_results(results, file_paths)
     else:
-        print_result(result, file_path)
+        for file_path, result in zip(file_paths, results):
+            print_result(result, file_path)
 
-    # Exit code based on result
-    if not result.valid:
+    # Exit code based on the worst result
+    if not all(result.valid for result in results):
         sys.exit(1)
-    elif result.warnings:
+    elif any(result.warnings for result in results):
         sys.exit(2)
     else:
         sys.exit(0)
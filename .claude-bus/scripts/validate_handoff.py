@@ -18,7 +18,9 @@ import os
 import re
 import sys
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
+from typing import List
 
 
 # =============================================================================
@@ -34,20 +36,34 @@ REQUIRED_SECTIONS = [
 ]
 
 REQUIRED_FIELDS = [
-    ("Stage", r"\*\*Stage\*\*:\s*(\d+|Unknown)"),
-    ("Phase", r"\*\*Phase\*\*:\s*(\d+|Unknown)"),
-    ("Status", r"\*\*Status\*\*:\s*(\w+)"),
-    ("Created", r"\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2})"),
-    ("Trigger", r"\*\*Trigger\*\*:\s*(\w+)"),
+    ("Stage", re.compile(r"\*\*Stage\*\*:\s*(\d+|Unknown)")),
+    ("Phase", re.compile(r"\*\*Phase\*\*:\s*(\d+|Unknown)")),
+    ("Status", re.compile(r"\*\*Status\*\*:\s*(\w+)")),
+    ("Created", re.compile(r"\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2})")),
+    ("Trigger", re.compile(r"\*\*Trigger\*\*:\s*(\w+)")),
 ]
 
+# Threads for validate_all_handoffs; the per-file read dominates and
+# releases the GIL, which matters most on network filesystems
+HANDOFF_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_CREATED_RE = re.compile(r"\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2}T[\d:]+)")
+
 
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
 
 def validate_handoff(file_path: Path) -> dict:
-    """Validate a handoff document."""
+    """
+    Validate a handoff document.
+
+    Args:
+        file_path: Handoff file to read and check
+
+    Returns:
+        Result dict with valid, errors, warnings and info
+    """
     result = {
         "valid": True,
         "errors": [],
@@ -55,13 +71,13 @@ def validate_handoff(file_path: Path) -> dict:
         "info": [],
     }
 
-    if not file_path.exists():
+    # One open() instead of an exists() stat followed by the read
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
         result["valid"] = False
         result["errors"].append(f"File not found: {file_path}")
         return result
-
-    try:
-        content = file_path.read_text(encoding="utf-8")
     except Exception as e:
         result["valid"] = False
         result["errors"].append(f"Cannot read file: {e}")
@@ -75,17 +91,18 @@ def validate_handoff(file_path: Path) -> dict:
 
     # Check required fields
     for field_name, pattern in REQUIRED_FIELDS:
-        match = re.search(pattern, content)
+        match = pattern.search(content)
         if not match:
             result["warnings"].append(f"Missing field: {field_name}")
         else:
             result["info"].append(f"{field_name}: {match.group(1)}")
 
     # Check for timestamp validity
-    created_match = re.search(r"\*\*Created\*\*:\s*(\d{4}-\d{2}-\d{2}T[\d:]+)", content)
+    created_match = _CREATED_RE.search(content)
     if created_match:
         try:
-            created_time = datetime.fromisoformat(created_match.group(1).replace("Z", ""))
+            # _CREATED_RE stops before any "Z" suffix, so the match parses as-is
+            created_time = datetime.fromisoformat(created_match.group(1))
             if created_time > datetime.now():
                 result["errors"].append("Created timestamp is in the future")
                 result["valid"] = False
@@ -107,17 +124,29 @@ def validate_handoff(file_path: Path) -> dict:
 
 
 def get_latest_handoff() -> Path:
-    """Get the most recent handoff file."""
-    if not HANDOFFS_DIR.exists():
+    """Get the most recently modified handoff file."""
+    latest = latest_mtime = None
+    try:
+        entries = os.scandir(HANDOFFS_DIR)
+    except (FileNotFoundError, NotADirectoryError):
         return None
+    with entries:
+        for entry in entries:
+            if not fnmatchcase(entry.name, "session-*.md"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue  # Dangling symlink, or removed since the listing
+            # One pass keeping the newest; ties go to the first listed
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = entry.path, mtime
+    return Path(latest) if latest is not None else None
 
-    handoffs = list(HANDOFFS_DIR.glob("session-*.md"))
-    if not handoffs:
-        return None
 
-    # Sort by modification time
-    handoffs.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    return handoffs[0]
+def _validate_batch(paths: List[Path]) -> List[dict]:
+    """validate_handoff over paths, in order (one thread-pool task)."""
+    return [validate_handoff(p) for p in paths]
 
 
 def validate_all_handoffs() -> dict:
@@ -129,12 +158,30 @@ def validate_all_handoffs() -> dict:
         "files": [],
     }
 
-    if not HANDOFFS_DIR.exists():
+    try:
+        with os.scandir(HANDOFFS_DIR) as entries:
+            handoff_files = [
+                Path(e.path) for e in entries if fnmatchcase(e.name, "session-*.md")
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return results
 
-    for handoff_file in HANDOFFS_DIR.glob("session-*.md"):
+    # Reads overlap across threads. Each task validates a contiguous batch
+    # (a per-file future costs about as much as a cached local read), and
+    # map keeps results in directory order.
+    if len(handoff_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(HANDOFF_WORKERS, len(handoff_files))
+        size = max(1, len(handoff_files) // (workers * 4))
+        batches = [handoff_files[i:i + size] for i in range(0, len(handoff_files), size)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            validations = [v for batch in pool.map(_validate_batch, batches) for v in batch]
+    else:
+        validations = [validate_handoff(p) for p in handoff_files]
+
+    for handoff_file, validation in zip(handoff_files, validations):
         results["total"] += 1
-        validation = validate_handoff(handoff_file)
 
         file_result = {
             "file": str(handoff_file.name),
@@ -156,37 +203,34 @@ def validate_all_handoffs() -> dict:
 # CLI
 # =============================================================================
 
+_VALIDATOR_BANNER = (
+    "╔════════════════════════════════════════════════════════════╗",
+    "║  📄 Handoff Document Validator (P2-004)                    ║",
+    "╚════════════════════════════════════════════════════════════╝",
+)
+
+
 def print_result(file_path: Path, result: dict) -> None:
     """Print validation result."""
-    print("")
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║  📄 Handoff Document Validator (P2-004)                    ║")
-    print("╚════════════════════════════════════════════════════════════╝")
-    print("")
-    print(f"File: {file_path}")
-    print("")
-
     status = "✅ VALID" if result["valid"] else "❌ INVALID"
-    print(f"Status: {status}")
-    print("")
+    lines = ["", *_VALIDATOR_BANNER, "", f"File: {file_path}", "", f"Status: {status}", ""]
 
     if result["errors"]:
-        print("Errors:")
-        for error in result["errors"]:
-            print(f"  ❌ {error}")
-        print("")
+        lines.append("Errors:")
+        lines.extend(f"  ❌ {error}" for error in result["errors"])
+        lines.append("")
 
     if result["warnings"]:
-        print("Warnings:")
-        for warning in result["warnings"]:
-            print(f"  ⚠️  {warning}")
-        print("")
+        lines.append("Warnings:")
+        lines.extend(f"  ⚠️  {warning}" for warning in result["warnings"])
+        lines.append("")
 
     if result["info"]:
-        print("Info:")
-        for info in result["info"]:
-            print(f"  ℹ️  {info}")
-        print("")
+        lines.append("Info:")
+        lines.extend(f"  ℹ️  {info}" for info in result["info"])
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
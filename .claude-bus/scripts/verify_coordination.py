@@ -20,9 +20,12 @@ import os
 import re
 import sys
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import json_compat
 
 
 # =============================================================================
@@ -31,6 +34,7 @@ from typing import Dict, List, Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 EVENTS_FILE = PROJECT_ROOT / ".claude-bus" / "events.jsonl"
+TAIL_CHUNK = 64 * 1024  # events.jsonl is read backwards in blocks this size
 
 REQUIRED_AGENTS = [
     "PM-Architect-Agent",
@@ -42,6 +46,14 @@ REQUIRED_AGENTS = [
     "frontend-debug-agent",
 ]
 
+# Case-folded agent names, in REQUIRED_AGENTS order
+_AGENTS_LOWER = tuple((agent.lower(), agent) for agent in REQUIRED_AGENTS)
+
+# "phase 2" / "phase2" mentions, as matched by verify_phase_coordination
+_PHASE_MENTION_RE = re.compile(r"phase ?(\d+)")
+# First phase number in an event, for extract_agent_invocations contexts
+_PHASE_CONTEXT_RE = re.compile(r"phase\s*(\d+)")
+
 # Expected coordination patterns
 EXPECTED_PATTERNS = {
     "gate_validation": {
@@ -66,22 +78,49 @@ EXPECTED_PATTERNS = {
 # EVENT PARSING
 # =============================================================================
 
+def _tail_lines(path: Path, n: int) -> List[bytes]:
+    """
+    Return the last n lines of path, without line terminators.
+
+    Reads backwards from the end in TAIL_CHUNK blocks until n + 1 newlines
+    are found, so only the tail of a large log is read. Like
+    readlines()[-n:], n <= 0 slices from the front of the whole file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        while pos > 0 and (n <= 0 or newlines <= n):
+            step = min(TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(reversed(chunks)).split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()  # Trailing newline, not an empty last line
+    if pos > 0:
+        lines = lines[1:]  # Partial line before the first newline read
+    return lines[-n:]
+
+
 def parse_events(limit: int = 500) -> List[dict]:
-    """Parse events from events.jsonl."""
+    """Parse the last limit events from events.jsonl."""
     events = []
 
     if not EVENTS_FILE.exists():
         return events
 
     try:
-        with open(EVENTS_FILE, "r") as f:
-            lines = f.readlines()[-limit:]
+        lines = _tail_lines(EVENTS_FILE, limit)
 
         for line in lines:
             try:
-                event = json.loads(line.strip())
+                event = json_compat.loads(line)
                 events.append(event)
-            except json.JSONDecodeError:
+            except ValueError:  # Malformed JSON or invalid UTF-8
                 continue
 
     except Exception:
@@ -90,39 +129,123 @@ def parse_events(limit: int = 500) -> List[dict]:
     return events
 
 
-def extract_agent_invocations(events: List[dict]) -> Dict[str, List[dict]]:
-    """Extract agent invocation events grouped by context."""
+def _collect_strings(obj: Any, out: List[str]) -> None:
+    """Append every dict key and string value in obj to out."""
+    if isinstance(obj, str):
+        out.append(obj)
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            out.append(str(key))
+            _collect_strings(value, out)
+    elif isinstance(obj, list):
+        for value in obj:
+            _collect_strings(value, out)
+
+
+def _event_text(event: dict) -> str:
+    """
+    Lowercased searchable text of an event: its keys and string values.
+
+    Walks the event instead of serializing it with json.dumps. Fields are
+    joined with NUL so a pattern cannot match across two of them.
+    """
+    parts: List[str] = []
+    _collect_strings(event, parts)
+    return "\x00".join(parts).lower()
+
+
+def _agents_in(event_str: str) -> List[str]:
+    """REQUIRED_AGENTS mentioned in lowercased event text."""
+    return [agent for lower, agent in _AGENTS_LOWER if lower in event_str]
+
+
+@dataclass
+class EventIndex:
+    """Per-event text and mentioned agents, bucketed by context in one pass."""
+    texts: List[str]
+    agents: List[FrozenSet[str]]  # REQUIRED_AGENTS mentioned, parallel to texts
+    gate_agents: List[FrozenSet[str]]
+    phase_agents: Dict[str, List[FrozenSet[str]]]
+
+
+def index_events(events: List[dict]) -> EventIndex:
+    """
+    Build the EventIndex consumed by the coordination verifiers.
+
+    Each event is walked and scanned for agent names once; buckets hold
+    the per-event agent sets, so verifiers only union them. Phase buckets are keyed by every leading
+    prefix of the mentioned number, so "phase 23" lands in "2" and "23".
+    That keeps the substring semantics of a plain `"phase 2" in text`
+    check.
+    """
+    texts = [_event_text(event) for event in events]
+    agents = [frozenset(_agents_in(text)) for text in texts]
+    gate_agents: List[FrozenSet[str]] = []
+    phase_agents: Dict[str, List[FrozenSet[str]]] = defaultdict(list)
+    for text, mentioned in zip(texts, agents):
+        if "gate" in text:
+            gate_agents.append(mentioned)
+        if "phase" not in text:
+            continue
+        keys = set()
+        for match in _PHASE_MENTION_RE.finditer(text):
+            digits = match.group(1)
+            keys.update(digits[:i] for i in range(1, len(digits) + 1))
+        for key in keys:
+            phase_agents[key].append(mentioned)
+    return EventIndex(texts, agents, gate_agents, dict(phase_agents))
+
+
+def extract_agent_invocations(
+    events: List[dict], index: Optional[EventIndex] = None
+) -> Dict[str, List[dict]]:
+    """
+    Extract agent invocation events grouped by context.
+
+    Args:
+        events: Parsed events
+        index: Prebuilt index_events(events); its per-event text and agent
+            sets are reused instead of walking the events again
+    """
+    index = index or index_events(events)
     invocations = defaultdict(list)
 
-    for event in events:
-        event_str = json.dumps(event).lower()
-
+    for event, event_str, mentioned in zip(events, index.texts, index.agents):
         # Look for agent mentions
-        for agent in REQUIRED_AGENTS:
-            if agent.lower() in event_str:
-                # Determine context (gate, phase, etc.)
-                context = "unknown"
-                if "gate" in event_str:
-                    context = "gate"
-                elif "phase" in event_str:
-                    # Extract phase number
-                    phase_match = re.search(r"phase\s*(\d+)", event_str)
-                    if phase_match:
-                        context = f"phase_{phase_match.group(1)}"
-                elif "task" in event_str:
-                    context = "task"
-
-                invocations[context].append({
-                    "agent": agent,
-                    "timestamp": event.get("timestamp", ""),
-                    "event_type": event.get("type", ""),
-                })
+        if not mentioned:
+            continue
+        agents = [agent for _, agent in _AGENTS_LOWER if agent in mentioned]
+
+        # Determine context (gate, phase, etc.)
+        context = "unknown"
+        if "gate" in event_str:
+            context = "gate"
+        elif "phase" in event_str:
+            # Extract phase number
+            phase_match = _PHASE_CONTEXT_RE.search(event_str)
+            if phase_match:
+                context = f"phase_{phase_match.group(1)}"
+        elif "task" in event_str:
+            context = "task"
+
+        for agent in agents:
+            invocations[context].append({
+                "agent": agent,
+                "timestamp": event.get("timestamp", ""),
+                "event_type": event.get("type", ""),
+            })
 
     return dict(invocations)
 
 
-def verify_gate_coordination(events: List[dict]) -> dict:
-    """Verify that gate validations have proper agent coordination."""
+def verify_gate_coordination(events: List[dict], index: Optional[EventIndex] = None) -> dict:
+    """
+    Verify that gate validations have proper agent coordination.
+
+    Args:
+        events: Parsed events
+        index: Prebuilt index_events(events), shared across verifiers
+    """
     result = {
         "pattern": "gate_validation",
         "verified": False,
@@ -132,19 +255,14 @@ def verify_gate_coordination(events: List[dict]) -> dict:
     }
 
     # Look for gate-related events
-    gate_events = [e for e in events if "gate" in json.dumps(e).lower()]
+    gate_agents = (index or index_events(events)).gate_agents
 
-    if not gate_events:
+    if not gate_agents:
         result["findings"].append("No gate events found in recent history")
         return result
 
     # Check which agents were involved
-    agents_found = set()
-    for event in gate_events:
-        event_str = json.dumps(event).lower()
-        for agent in REQUIRED_AGENTS:
-            if agent.lower() in event_str:
-                agents_found.add(agent)
+    agents_found = set().union(*gate_agents)
 
     result["agents_found"] = list(agents_found)
     result["agent_count"] = len(agents_found)
@@ -161,8 +279,17 @@ def verify_gate_coordination(events: List[dict]) -> dict:
     return result
 
 
-def verify_phase_coordination(events: List[dict], phase: int) -> dict:
-    """Verify coordination for a specific phase."""
+def verify_phase_coordination(
+    events: List[dict], phase: int, index: Optional[EventIndex] = None
+) -> dict:
+    """
+    Verify coordination for a specific phase.
+
+    Args:
+        events: Parsed events
+        phase: Phase number to verify
+        index: Prebuilt index_events(events), shared across verifiers
+    """
     result = {
         "pattern": f"phase_{phase}",
         "verified": False,
@@ -171,23 +298,14 @@ def verify_phase_coordination(events: List[dict], phase: int) -> dict:
     }
 
     # Look for phase-specific events
-    phase_events = [
-        e for e in events
-        if f"phase {phase}" in json.dumps(e).lower()
-        or f"phase{phase}" in json.dumps(e).lower()
-    ]
+    phase_agents = (index or index_events(events)).phase_agents.get(str(phase), [])
 
-    if not phase_events:
+    if not phase_agents:
         result["findings"].append(f"No events found for Phase {phase}")
         return result
 
     # Check which agents were involved
-    agents_found = set()
-    for event in phase_events:
-        event_str = json.dumps(event).lower()
-        for agent in REQUIRED_AGENTS:
-            if agent.lower() in event_str:
-                agents_found.add(agent)
+    agents_found = set().union(*phase_agents)
 
     result["agents_found"] = list(agents_found)
 
@@ -223,13 +341,15 @@ def generate_coordination_report(events: List[dict]) -> dict:
         "overall_status": "UNKNOWN",
     }
 
+    index = index_events(events)
+
     # Verify gate coordination
-    gate_result = verify_gate_coordination(events)
+    gate_result = verify_gate_coordination(events, index)
     report["verifications"].append(gate_result)
 
     # Verify phase coordination for phases 2 and 3
     for phase in [2, 3]:
-        phase_result = verify_phase_coordination(events, phase)
+        phase_result = verify_phase_coordination(events, phase, index)
         report["verifications"].append(phase_result)
 
     # Determine overall status
@@ -250,29 +370,36 @@ def generate_coordination_report(events: List[dict]) -> dict:
 # CLI
 # =============================================================================
 
+_REPORT_BANNER = (
+    "=" * 60,
+    "  Multi-Agent Coordination Verifier (P2-002)",
+    "=" * 60,
+)
+
+
 def print_report(report: dict) -> None:
     """Print coordination report in human-readable format."""
-    print("")
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║  🤝 Multi-Agent Coordination Verifier (P2-002)             ║")
-    print("╚════════════════════════════════════════════════════════════╝")
-    print("")
-    print(f"Events analyzed: {report['events_analyzed']}")
-    print(f"Report time: {report['timestamp']}")
-    print("")
+    lines = [
+        "", *_REPORT_BANNER, "",
+        f"Events analyzed: {report['events_analyzed']}",
+        f"Report time: {report['timestamp']}",
+        "",
+    ]
+    add = lines.append
 
     for verification in report["verifications"]:
         status = "✅" if verification["verified"] else "❌"
-        print(f"{status} {verification['pattern']}")
-        for finding in verification["findings"]:
-            print(f"   └─ {finding}")
+        add(f"{status} {verification['pattern']}")
+        lines.extend(f"   └─ {finding}" for finding in verification["findings"])
         if verification["agents_found"]:
-            print(f"   └─ Agents: {', '.join(verification['agents_found'][:5])}")
-        print("")
+            add(f"   └─ Agents: {', '.join(verification['agents_found'][:5])}")
+        add("")
+
+    add("=" * 60)
+    add(f"Overall Status: {report['overall_status']}")
+    add("")
 
-    print("=" * 60)
-    print(f"Overall Status: {report['overall_status']}")
-    print("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():